@@ -6,7 +6,8 @@ with proper error handling and configuration management.
 """
 
 import logging
-from typing import Dict, Any, Optional, Type
+from collections import deque
+from typing import Dict, Any, List, NoReturn, Optional, Type
 from datetime import datetime
 
 from .interfaces import (
@@ -24,6 +25,19 @@ from .exceptions import (
 from ..utils.config import Config
 from ..utils.logger import setup_logger
 
+# Shared read-only default for config section lookups; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+
+def _raise_config_error(component: str, config_key: str, config_value: Any, exc: Exception) -> NoReturn:
+    """Raise the ConfigurationError shared by the component creation methods."""
+    raise ConfigurationError(
+        f"{component} creation failed",
+        config_key=config_key,
+        config_value=config_value,
+        original_exception=exc
+    ) from exc
+
 
 class ComponentFactory:
     """
@@ -51,8 +65,12 @@ class ComponentFactory:
         
         # All workers now use the same underlying system - no role restrictions
         
-        # Component creation history for debugging
-        self._creation_history: list = []
+        # Component creation history for debugging (bounded)
+        self._creation_history: deque = deque(maxlen=self.config.get('history_limit', 1024))
+        
+        # Opt-in pool of released workers available for reuse
+        self._worker_pool: List[Worker] = []
+        self._pool_max = self.config.get('worker_pool_size', 0)
         
         self.logger.info("Component factory initialized")
     
@@ -81,7 +99,7 @@ class ComponentFactory:
             storage_backend = memory_config.get('storage_backend', 'sqlite')
             db_path = memory_config.get('database_path', 'botted_library_memory.db')
             
-            self.logger.info(f"Creating memory system with backend: {storage_backend}")
+            self.logger.info("Creating memory system with backend: %s", storage_backend)
             
             self._memory_system = MemorySystem(
                 storage_backend=storage_backend,
@@ -92,13 +110,8 @@ class ComponentFactory:
             return self._memory_system
             
         except Exception as e:
-            self.logger.error(f"Failed to create memory system: {str(e)}")
-            raise ConfigurationError(
-                "Memory system creation failed",
-                config_key='memory',
-                config_value=memory_config,
-                original_exception=e
-            )
+            self.logger.error("Failed to create memory system: %s", e)
+            _raise_config_error("Memory system", 'memory', memory_config, e)
     
     def create_knowledge_validator(self, config: Dict[str, Any] = None) -> IKnowledgeValidator:
         """
@@ -128,7 +141,7 @@ class ComponentFactory:
                 'docs.python.org', 'developer.mozilla.org'
             ])
             
-            self.logger.info(f"Creating knowledge validator with {len(trusted_sources)} trusted sources")
+            self.logger.info("Creating knowledge validator with %d trusted sources", len(trusted_sources))
             
             self._knowledge_validator = KnowledgeValidator(
                 db_path=db_path,
@@ -140,13 +153,8 @@ class ComponentFactory:
             return self._knowledge_validator
             
         except Exception as e:
-            self.logger.error(f"Failed to create knowledge validator: {str(e)}")
-            raise ConfigurationError(
-                "Knowledge validator creation failed",
-                config_key='knowledge',
-                config_value=knowledge_config,
-                original_exception=e
-            )
+            self.logger.error("Failed to create knowledge validator: %s", e)
+            _raise_config_error("Knowledge validator", 'knowledge', knowledge_config, e)
     
     def create_browser_controller(self, config: Dict[str, Any] = None) -> IBrowserController:
         """
@@ -173,7 +181,7 @@ class ComponentFactory:
             headless = browser_config.get('headless', True)
             browser_type = browser_config.get('browser_type', 'chrome')
             
-            self.logger.info(f"Creating browser controller: {browser_type} (headless: {headless})")
+            self.logger.info("Creating browser controller: %s (headless: %s)", browser_type, headless)
             
             self._browser_controller = BrowserController(
                 headless=headless,
@@ -184,13 +192,8 @@ class ComponentFactory:
             return self._browser_controller
             
         except Exception as e:
-            self.logger.error(f"Failed to create browser controller: {str(e)}")
-            raise ConfigurationError(
-                "Browser controller creation failed",
-                config_key='browser',
-                config_value=browser_config,
-                original_exception=e
-            )
+            self.logger.error("Failed to create browser controller: %s", e)
+            _raise_config_error("Browser controller", 'browser', browser_config, e)
     
     def create_task_executor(self, config: Dict[str, Any] = None) -> ITaskExecutor:
         """
@@ -226,13 +229,8 @@ class ComponentFactory:
             return self._task_executor
             
         except Exception as e:
-            self.logger.error(f"Failed to create task executor: {str(e)}")
-            raise ConfigurationError(
-                "Task executor creation failed",
-                config_key='task_executor',
-                config_value=task_config,
-                original_exception=e
-            )
+            self.logger.error("Failed to create task executor: %s", e)
+            _raise_config_error("Task executor", 'task_executor', task_config, e)
     
     def create_worker(self, worker_id: str, role: str, config: Dict[str, Any] = None) -> Worker:
         """
@@ -251,20 +249,28 @@ class ComponentFactory:
             ConfigurationError: If configuration is invalid
         """
         try:
-            self.logger.info(f"Creating worker {worker_id} with role {role}")
+            self.logger.info("Creating worker %s with role %s", worker_id, role)
             
             # All workers use the same underlying system - role is just for context
             
-            # Create all required dependencies
-            memory_system = self.create_memory_system()
-            knowledge_validator = self.create_knowledge_validator()
-            browser_controller = self.create_browser_controller()
-            task_executor = self.create_task_executor()
+            # Reuse cached dependencies directly when the factory is warm,
+            # otherwise create whichever ones are still missing
+            deps = (
+                self._memory_system,
+                self._knowledge_validator,
+                self._browser_controller,
+                self._task_executor
+            )
+            if all(dep is not None for dep in deps):
+                memory_system, knowledge_validator, browser_controller, task_executor = deps
+            else:
+                memory_system = self.create_memory_system()
+                knowledge_validator = self.create_knowledge_validator()
+                browser_controller = self.create_browser_controller()
+                task_executor = self.create_task_executor()
             
             # Merge worker configuration
-            worker_config = {**self.config.get('worker', {})}
-            if config:
-                worker_config.update(config)
+            worker_config = self._merged_config(self.config.get('worker', _EMPTY), config)
             
             # Create worker with all dependencies
             worker = Worker(
@@ -285,11 +291,11 @@ class ComponentFactory:
                 'config': worker_config
             })
             
-            self.logger.info(f"Successfully created worker {worker_id} with role {role}")
+            self.logger.info("Successfully created worker %s with role %s", worker_id, role)
             return worker
             
         except Exception as e:
-            self.logger.error(f"Failed to create worker {worker_id}: {str(e)}")
+            self.logger.error("Failed to create worker %s: %s", worker_id, e)
             if isinstance(e, (WorkerError, ConfigurationError)):
                 raise
             else:
@@ -300,6 +306,60 @@ class ComponentFactory:
                     original_exception=e
                 )
     
+    def acquire_worker(self, worker_id: str, role: str, config: Dict[str, Any] = None) -> Worker:
+        """
+        Get a worker from the pool, or create one if the pool is empty.
+        
+        Pooled workers share this factory's cached subsystems, so reusing
+        one skips worker construction and only rebinds identity and role.
+        
+        Args:
+            worker_id: Unique identifier for the worker
+            role: Role type for the worker
+            config: Optional worker configuration
+            
+        Returns:
+            Worker: Worker bound to the given id and role
+            
+        Raises:
+            WorkerError: If worker creation or role initialization fails
+            ConfigurationError: If configuration is invalid
+        """
+        if not self._worker_pool:
+            return self.create_worker(worker_id, role, config)
+        
+        worker = self._worker_pool.pop()
+        
+        # Same config create_worker would build, so nothing carries over
+        # from the worker's previous user
+        worker_config = self._merged_config(self.config.get('worker', _EMPTY), config)
+        
+        worker.reassign(worker_id, role, worker_config)
+        
+        self.logger.info("Reused pooled worker for %s with role %s", worker_id, role)
+        return worker
+    
+    def release_worker(self, worker: Worker) -> bool:
+        """
+        Return a worker to the pool for later reuse.
+        
+        The worker is reset via ``Worker.reset_state()`` and must not be
+        used by the caller after release. Workers are dropped when pooling
+        is disabled or the pool is already at ``worker_pool_size``.
+        
+        Args:
+            worker: Worker previously obtained from this factory
+            
+        Returns:
+            bool: True if the worker was added to the pool
+        """
+        if len(self._worker_pool) >= self._pool_max:
+            return False
+        
+        worker.reset_state()
+        self._worker_pool.append(worker)
+        return True
+    
     def create_role_instance(self, role: str, config: Dict[str, Any] = None):
         """
         Create a role instance - simplified since all workers have the same capabilities.
@@ -312,11 +372,9 @@ class ComponentFactory:
             Generic role instance
         """
         try:
-            role_config = {**self.config.get('roles', {}).get(role, {})}
-            if config:
-                role_config.update(config)
+            role_config = self._merged_config(self.config.get('roles', _EMPTY).get(role, _EMPTY), config)
             
-            self.logger.info(f"Creating role instance: {role}")
+            self.logger.info("Creating role instance: %s", role)
             
             # Create a simple role object since all workers have the same capabilities
             class GenericRole:
@@ -340,7 +398,7 @@ class ComponentFactory:
             return role_instance
             
         except Exception as e:
-            self.logger.error(f"Failed to create role {role}: {str(e)}")
+            self.logger.error("Failed to create role %s: %s", role, e)
             raise ConfigurationError(
                 f"Role creation failed: {str(e)}",
                 config_key='role',
@@ -356,7 +414,7 @@ class ComponentFactory:
             role_name: Name of the role
             role_class: Role class to register
         """
-        self.logger.info(f"Registering custom role: {role_name}")
+        self.logger.info("Registering custom role: %s", role_name)
         # All workers have the same capabilities now
     
     def get_available_roles(self) -> list:
@@ -378,28 +436,27 @@ class ComponentFactory:
         }
         
         try:
-            # Validate memory configuration
-            memory_config = self.config.get('memory', {})
-            if 'database_path' in memory_config:
-                validation_results['config_summary']['memory_db'] = memory_config['database_path']
-            
-            # Validate knowledge configuration
-            knowledge_config = self.config.get('knowledge', {})
-            trusted_sources = knowledge_config.get('trusted_sources', [])
-            if len(trusted_sources) == 0:
-                validation_results['warnings'].append("No trusted sources configured for knowledge validation")
-            validation_results['config_summary']['trusted_sources_count'] = len(trusted_sources)
+            sections = self.config
+            memory_config = sections.get('memory') or _EMPTY
+            knowledge_config = sections.get('knowledge') or _EMPTY
+            browser_config = sections.get('browser') or _EMPTY
             
-            # Validate browser configuration
-            browser_config = self.config.get('browser', {})
+            trusted_sources_count = len(knowledge_config.get('trusted_sources') or _EMPTY)
             browser_type = browser_config.get('browser_type', 'chrome')
-            if browser_type not in ['chrome', 'firefox', 'edge']:
+            
+            if trusted_sources_count == 0:
+                validation_results['warnings'].append("No trusted sources configured for knowledge validation")
+            if browser_type not in ('chrome', 'firefox', 'edge'):
                 validation_results['warnings'].append(f"Unusual browser type: {browser_type}")
-            validation_results['config_summary']['browser_type'] = browser_type
             
-            # Skip role validation since all workers have the same capabilities
-            roles_config = self.config.get('roles', {})
-            # All roles are valid now
+            # Roles are not validated since all workers have the same capabilities
+            config_summary = {
+                'trusted_sources_count': trusted_sources_count,
+                'browser_type': browser_type
+            }
+            if 'database_path' in memory_config:
+                config_summary['memory_db'] = memory_config['database_path']
+            validation_results['config_summary'] = config_summary
             
         except Exception as e:
             validation_results['valid'] = False
@@ -409,7 +466,7 @@ class ComponentFactory:
     
     def get_creation_history(self) -> list:
         """Get history of component creation for debugging."""
-        return self._creation_history.copy()
+        return list(self._creation_history)
     
     def reset_components(self) -> None:
         """Reset all cached components (useful for testing)."""
@@ -420,7 +477,7 @@ class ComponentFactory:
             try:
                 self._browser_controller.close_browser()
             except Exception as e:
-                self.logger.warning(f"Error closing browser during reset: {str(e)}")
+                self.logger.warning("Error closing browser during reset: %s", e)
         
         # Clear component cache
         self._memory_system = None
@@ -428,9 +485,29 @@ class ComponentFactory:
         self._browser_controller = None
         self._task_executor = None
         
+        # Pooled workers hold references to the old components
+        self._worker_pool.clear()
+        
         # Clear creation history
         self._creation_history.clear()
     
+    @staticmethod
+    def _merged_config(base: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge a factory config section with a per-call override.
+        
+        Args:
+            base: Factory-level section configuration
+            config: Optional override applied on top of the section
+            
+        Returns:
+            New dict with the merged configuration, owned by the caller
+        """
+        merged = {**base}
+        if config:
+            merged.update(config)
+        return merged
+    
     def _record_creation(self, component_type: str, config: Dict[str, Any]) -> None:
         """Record component creation for debugging and monitoring."""
         creation_record = {
@@ -449,6 +526,7 @@ class ComponentFactory:
             'task_executor_created': self._task_executor is not None,
             'available_roles': ['any_role_name_is_valid'],
             'creation_history_count': len(self._creation_history),
+            'pooled_workers': len(self._worker_pool),
             'factory_config': self.config
         }
 
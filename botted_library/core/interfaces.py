@@ -5,13 +5,216 @@ Defines the contracts and boundaries between system components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, NoReturn, Optional, Tuple, Type, TypeVar
+from copy import deepcopy
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache, wraps
+import heapq
+from operator import attrgetter
 from datetime import datetime
 from enum import Enum
 import json
-import uuid
+import os
+import sys
+import threading
 from .exceptions import DataValidationError, SerializationError
+from ..utils.helpers import fast_json_dumps, fast_json_loads
+
+if sys.version_info >= (3, 11):
+    from typing import dataclass_transform
+else:
+    try:
+        from typing_extensions import dataclass_transform
+    except ImportError:
+        def dataclass_transform(**kwargs: Any) -> Callable[[Any], Any]:
+            """No-op stand-in; the marker is only read by type checkers"""
+            return lambda decorated: decorated
+
+
+# Data models drop the per-instance __dict__ where dataclasses support slots (3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# IDs are cut from a shared entropy buffer so bulk creation makes one
+# os.urandom call per _ID_BATCH_SIZE ids instead of one per id
+_ID_BATCH_SIZE = 16
+_id_lock = threading.Lock()
+_id_pool: List[str] = []
+
+
+def _new_id() -> str:
+    """Return a random 128-bit identifier as 32 hex characters"""
+    with _id_lock:
+        if not _id_pool:
+            buffer = os.urandom(16 * _ID_BATCH_SIZE)
+            _id_pool.extend(buffer[i:i + 16].hex() for i in range(0, len(buffer), 16))
+        return _id_pool.pop()
+
+
+def _reset_id_pool() -> None:
+    """Drop ids buffered by the parent process after a fork"""
+    global _id_lock
+    _id_lock = threading.Lock()
+    _id_pool.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+# Validation errors by registry id: (message, field_name, model_type, report).
+# Generated checks raise with ``_fail(<id>, v)`` so each failure branch is
+# one call with a constant argument.
+_ERRORS: List[Tuple[str, str, str, str]] = []
+_ERROR_IDS: Dict[Tuple[str, str, str, str], int] = {}
+
+
+def _register_error(model_type: str, field_name: str, message: str, report: str = 'value') -> int:
+    """Register a validation error (once) and return its id for ``_fail``"""
+    entry = (message, field_name, model_type, report)
+    error = _ERROR_IDS.get(entry)
+    if error is None:
+        error = _ERROR_IDS[entry] = len(_ERRORS)
+        _ERRORS.append(entry)
+    return error
+
+
+def _fail(error: int, value: Any) -> None:
+    """
+    Raise the registered DataValidationError ``error`` for ``value``.
+    
+    The error's ``report`` says what to record as the field value: the
+    value itself (``'value'``), its type name (``'type'``), its keys
+    (``'keys'``) or ``'mixed types'`` (``'mixed'``). Deriving it here keeps
+    that work off the path where validation passes.
+    """
+    message, field_name, model_type, report = _ERRORS[error]
+    if report == 'type':
+        value = type(value).__name__
+    elif report == 'keys':
+        value = list(value.keys())
+    elif report == 'mixed':
+        value = 'mixed types'
+    raise DataValidationError(message, field_name=field_name, field_value=value, model_type=model_type)
+
+
+def _check_lines(model_type: str, checks: List[Tuple[str, str, str, str]]) -> List[str]:
+    """Emit the source lines for a table of validation checks"""
+    lines = []
+    current_field = None
+    for field_name, condition, message, report in checks:
+        if field_name != current_field:
+            lines.append(f'    v = {field_name}')
+            current_field = field_name
+        error = _register_error(model_type, field_name, message, report)
+        lines.append(f'    if {condition}:')
+        lines.append(f'        _fail({error}, v)')
+    return lines
+
+
+class _ValidatedModel:
+    """
+    Base of the data models built by ``_validated_dataclass``.
+    
+    Declares the methods the decorator generates, for type checkers only;
+    at runtime the generated methods are the only definitions.
+    """
+    
+    __slots__ = ()
+    
+    if TYPE_CHECKING:
+        def validate(self) -> None:
+            """Validate the model's fields"""
+            ...
+        
+        @classmethod
+        def _new_trusted(cls: Type['_Model'], **values: Any) -> '_Model':
+            """Construct an instance, checking only fields not in ``_TRUSTED_FIELDS``"""
+            ...
+
+
+_Model = TypeVar('_Model', bound=_ValidatedModel)
+
+
+def _compile(cls: type, source_lines: List[str], name: str,
+             namespace: Dict[str, Any]) -> Callable[..., None]:
+    """Compile a generated method for ``cls``"""
+    exec('\n'.join(source_lines), globals(), namespace)
+    method = namespace[name]
+    method.__qualname__ = f'{cls.__name__}.{name}'
+    return method
+
+
+@dataclass_transform(field_specifiers=(field,))
+def _validated_dataclass(cls: Type[_Model]) -> Type[_Model]:
+    """
+    Turn ``cls`` into a dataclass whose ``__init__`` validates as it assigns.
+    
+    The class declares its checks in ``_CHECKS`` as
+    ``(field_name, invalid_condition, message, report)`` tuples.
+    Conditions are source expressions over ``v`` (the field being checked)
+    and the other field names; type checks test ``type(v) is X`` first and
+    fall back to isinstance, so subclasses are still accepted. ``report`` is
+    passed on to ``_fail``, which is only called when a check fails. ``_DISPATCH_CHECKS`` holds statements
+    run after the table, for checks selected by another field's value.
+    Fields listed in ``_EMPTY_IF_NONE`` are replaced by an empty dict when
+    passed as None. Both ``__init__`` and the public ``validate()`` are
+    compiled once from the same table into straight-line code.
+    
+    Classes whose factory helpers build some fields themselves list them in
+    ``_TRUSTED_FIELDS``; ``_new_trusted`` then constructs an instance
+    checking only the remaining fields, leaving the dispatch checks to the
+    helper.
+    
+    Setting ``_FROZEN`` makes the dataclass frozen; the generated
+    constructors then assign through ``object.__setattr__``.
+    
+    Decorated classes derive from ``_ValidatedModel``, which declares the
+    generated methods; ``dataclass_transform`` lets type checkers derive
+    the ``__init__`` signature from the fields.
+    """
+    frozen = getattr(cls, '_FROZEN', False)
+    model: Any = dataclass(init=False, frozen=frozen, **_DATACLASS_OPTIONS)(cls)
+    model_type = model.__name__
+    names = [f.name for f in fields(model)]
+    if frozen:
+        assignments = [f'    object.__setattr__(self, {name!r}, {name})' for name in names]
+    else:
+        assignments = [f'    self.{name} = {name}' for name in names]
+    check_lines = _check_lines(model_type, model._CHECKS)
+    check_lines.extend(f'    {statement}' for statement in getattr(model, '_DISPATCH_CHECKS', ()))
+    
+    init_namespace: Dict[str, Any] = {}
+    params = []
+    for f in fields(model):
+        if f.default is MISSING:
+            params.append(f.name)
+        else:
+            init_namespace[f'_default_{f.name}'] = f.default
+            params.append(f'{f.name}=_default_{f.name}')
+    init_lines = [f'def __init__(self, {", ".join(params)}):']
+    for name in getattr(model, '_EMPTY_IF_NONE', ()):
+        init_lines.append(f'    if {name} is None:')
+        init_lines.append(f'        {name} = {{}}')
+    init_lines.extend(check_lines)
+    init_lines.extend(assignments)
+    model.__init__ = _compile(model, init_lines, '__init__', init_namespace)
+    
+    validate_lines = ['def validate(self):']
+    validate_lines.extend(f'    {name} = self.{name}' for name in names)
+    validate_lines.extend(check_lines)
+    model.validate = _compile(model, validate_lines, 'validate', {})
+    model.validate.__doc__ = f'Validate {model_type} data'
+    
+    trusted = getattr(model, '_TRUSTED_FIELDS', None)
+    if trusted:
+        trusted_lines = [f'def _new_trusted(cls, {", ".join(names)}):',
+                         '    self = object.__new__(cls)']
+        trusted_lines.extend(_check_lines(model_type, [check for check in model._CHECKS
+                                                       if check[0] not in trusted]))
+        trusted_lines.extend(assignments)
+        trusted_lines.append('    return self')
+        model._new_trusted = classmethod(_compile(model, trusted_lines, '_new_trusted', {}))
+    return model
 
 
 class TaskStatus(Enum):
@@ -45,8 +248,137 @@ class WorkerType(Enum):
     VERIFIER = "verifier"
 
 
-@dataclass
-class Task:
+# Value -> member maps used to decode enums without going through Enum.__call__
+_STATUS_LOOKUP: Dict[Any, Enum] = TaskStatus._value2member_map_
+_MEMORY_TYPE_LOOKUP: Dict[Any, Enum] = MemoryType._value2member_map_
+_ACTION_TYPE_LOOKUP: Dict[Any, Enum] = ActionType._value2member_map_
+
+# Browser action parameter keys, shared by validation and the create_* helpers
+_SELECTOR = sys.intern('selector')
+_COORDINATES = sys.intern('coordinates')
+_TEXT = sys.intern('text')
+_DIRECTION = sys.intern('direction')
+_AMOUNT = sys.intern('amount')
+_TIMEOUT = sys.intern('timeout')
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict for parameters shared by cached BrowserAction instances
+    
+    Unlike a MappingProxyType it still copies, pickles and converts with
+    dataclasses.asdict like the plain dict it replaces.
+    """
+    
+    __slots__ = ()
+    
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+    
+    __setitem__: Any = _read_only
+    __delitem__: Any = _read_only
+    __ior__: Any = _read_only
+    clear: Any = _read_only
+    pop: Any = _read_only
+    popitem: Any = _read_only
+    setdefault: Any = _read_only
+    update: Any = _read_only
+    
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+        return type(self), (dict(self),)
+    
+    def __copy__(self) -> '_FrozenDict':
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> '_FrozenDict':
+        return type(self)(deepcopy(dict(self), memo))
+
+
+_CLICK_PARAMETERS_ERROR = _register_error(
+    'BrowserAction', 'parameters', "Click action must have either 'selector' or 'coordinates' parameter", 'keys')
+_TYPE_PARAMETERS_ERROR = _register_error(
+    'BrowserAction', 'parameters', "Type action must have 'text' parameter", 'keys')
+_SCROLL_PARAMETERS_ERROR = _register_error(
+    'BrowserAction', 'parameters', "Scroll action must have 'direction' parameter", 'keys')
+_WAIT_PARAMETERS_ERROR = _register_error(
+    'BrowserAction', 'parameters', "Wait action must have 'timeout' parameter", 'keys')
+
+
+def _check_click_parameters(parameters: Dict[str, Any]) -> None:
+    if _SELECTOR not in parameters and _COORDINATES not in parameters:
+        _fail(_CLICK_PARAMETERS_ERROR, parameters)
+
+
+def _check_type_parameters(parameters: Dict[str, Any]) -> None:
+    if _TEXT not in parameters:
+        _fail(_TYPE_PARAMETERS_ERROR, parameters)
+
+
+def _check_scroll_parameters(parameters: Dict[str, Any]) -> None:
+    if _DIRECTION not in parameters:
+        _fail(_SCROLL_PARAMETERS_ERROR, parameters)
+
+
+def _check_wait_parameters(parameters: Dict[str, Any]) -> None:
+    if _TIMEOUT not in parameters:
+        _fail(_WAIT_PARAMETERS_ERROR, parameters)
+
+
+def _no_parameter_check(parameters: Dict[str, Any]) -> None:
+    pass
+
+
+# Required-parameter check for each action type, so validation does one
+# lookup instead of comparing the action type against every case
+_ACTION_PARAMETER_CHECKS: Dict[ActionType, Callable[[Dict[str, Any]], None]] = {
+    ActionType.CLICK: _check_click_parameters,
+    ActionType.TYPE: _check_type_parameters,
+    ActionType.SCROLL: _check_scroll_parameters,
+    ActionType.WAIT: _check_wait_parameters,
+    ActionType.EXTRACT: _no_parameter_check,
+}
+
+
+# Distinct argument combinations remembered by each BrowserAction factory
+_ACTION_CACHE_SIZE = 1024
+
+
+def _memoized_factory(factory: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Cache a classmethod factory of a frozen model on its arguments.
+    
+    Calls with an unhashable argument (e.g. list coordinates) bypass the
+    cache. Failed constructions are not cached.
+    """
+    cached = lru_cache(maxsize=_ACTION_CACHE_SIZE)(factory)
+    
+    def wrapper(cls, *args, **kwargs):
+        try:
+            hash((args, tuple(kwargs.items())))
+        except TypeError:
+            return factory(cls, *args, **kwargs)
+        return cached(cls, *args, **kwargs)
+    
+    memoized: Any = wraps(factory)(wrapper)
+    memoized.cache_clear = cached.cache_clear
+    memoized.cache_info = cached.cache_info
+    return memoized
+
+
+def _enum_member(lookup: Dict[Any, Enum], enum_cls: Type[Enum], value: Any,
+                 field_name: str, model_type: str) -> Enum:
+    """Resolve an enum member from its serialized value (members pass through)"""
+    try:
+        return lookup[value]
+    except (KeyError, TypeError):
+        if isinstance(value, enum_cls):
+            return value
+        raise DataValidationError(f"Invalid {enum_cls.__name__} value",
+                                  field_name=field_name, field_value=value, model_type=model_type)
+
+
+@_validated_dataclass
+class Task(_ValidatedModel):
     """Data model for task representation"""
     id: str
     description: str
@@ -55,72 +387,107 @@ class Task:
     deadline: Optional[datetime] = None
     context: Dict[str, Any] = None
 
-    def __post_init__(self):
-        if self.context is None:
-            self.context = {}
-        self.validate()
-
-    def validate(self) -> None:
-        """Validate task data"""
-        if not self.id or not isinstance(self.id, str):
-            raise DataValidationError("Task ID must be a non-empty string", 
-                                    field_name="id", field_value=self.id, model_type="Task")
-        
-        if not self.description or not isinstance(self.description, str):
-            raise DataValidationError("Task description must be a non-empty string",
-                                    field_name="description", field_value=self.description, model_type="Task")
+    _EMPTY_IF_NONE = ('context',)
+    _CHECKS = [
+        ('id', 'not v or type(v) is not str and not isinstance(v, str)',
+         "Task ID must be a non-empty string", 'value'),
+        ('description', 'not v or type(v) is not str and not isinstance(v, str)',
+         "Task description must be a non-empty string", 'value'),
+        ('parameters', 'type(v) is not dict and not isinstance(v, dict)',
+         "Task parameters must be a dictionary", 'type'),
+        ('priority', 'not isinstance(v, int) or v < 0',
+         "Task priority must be a non-negative integer", 'value'),
+        ('deadline', 'v is not None and type(v) is not datetime and not isinstance(v, datetime)',
+         "Task deadline must be a datetime object or None", 'type'),
+        ('context', 'type(v) is not dict and not isinstance(v, dict)',
+         "Task context must be a dictionary", 'type'),
+    ]
+
+    def to_mapping(self) -> Dict[str, Any]:
+        """
+        Convert task to a dictionary of native field values
         
-        if not isinstance(self.parameters, dict):
-            raise DataValidationError("Task parameters must be a dictionary",
-                                    field_name="parameters", field_value=type(self.parameters).__name__, model_type="Task")
+        Unlike ``to_dict``, ``deadline`` stays a datetime, so records passed
+        between components in-process skip a format/parse round trip. Nested
+        containers are shared with the task.
+        """
+        return {
+            'id': self.id,
+            'description': self.description,
+            'parameters': self.parameters,
+            'priority': self.priority,
+            'deadline': self.deadline,
+            'context': self.context
+        }
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert task to dictionary for serialization
         
-        if not isinstance(self.priority, int) or self.priority < 0:
-            raise DataValidationError("Task priority must be a non-negative integer",
-                                    field_name="priority", field_value=self.priority, model_type="Task")
-        
-        if self.deadline is not None and not isinstance(self.deadline, datetime):
-            raise DataValidationError("Task deadline must be a datetime object or None",
-                                    field_name="deadline", field_value=type(self.deadline).__name__, model_type="Task")
-        
-        if not isinstance(self.context, dict):
-            raise DataValidationError("Task context must be a dictionary",
-                                    field_name="context", field_value=type(self.context).__name__, model_type="Task")
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary for serialization"""
-        data = asdict(self)
-        if self.deadline:
-            data['deadline'] = self.deadline.isoformat()
-        return data
+        The nested ``parameters`` and ``context`` are returned by reference
+        and must be treated as read-only unless ``copy`` is True.
+        """
+        data = {
+            'id': self.id,
+            'description': self.description,
+            'parameters': self.parameters,
+            'priority': self.priority,
+            'deadline': self.deadline.isoformat() if self.deadline else None,
+            'context': self.context
+        }
+        return deepcopy(data) if copy else data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
-        """Create task from dictionary"""
-        if 'deadline' in data and data['deadline']:
-            data['deadline'] = datetime.fromisoformat(data['deadline'])
+        """Create task from dictionary (converts fields of ``data`` in place)"""
+        deadline = data.get('deadline')
+        if deadline:
+            data['deadline'] = datetime.fromisoformat(deadline)
         return cls(**data)
 
     def to_json(self) -> str:
         """Convert task to JSON string"""
-        return json.dumps(self.to_dict())
+        return fast_json_dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'Task':
-        """Create task from JSON string"""
+        """Create task from JSON string (invalid data raises SerializationError)"""
         try:
-            data = json.loads(json_str)
+            data = fast_json_loads(json_str)
             return cls.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
             raise SerializationError("Failed to deserialize Task from JSON",
                                    data_type="Task", operation="from_json", original_exception=e)
 
+    @staticmethod
+    def to_json_array(items: List['Task']) -> str:
+        """Convert a list of tasks to one JSON array string"""
+        return fast_json_dumps([item.to_dict() for item in items])
+
+    @classmethod
+    def from_json_array(cls, json_str: str) -> List['Task']:
+        """
+        Create tasks from a JSON array string, parsed in one pass
+        
+        Invalid JSON or an invalid item raises SerializationError.
+        """
+        try:
+            items = fast_json_loads(json_str)
+            if not isinstance(items, list):
+                raise TypeError(f"expected a JSON array, got {type(items).__name__}")
+            from_dict = cls.from_dict
+            return [from_dict(data) for data in items]
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
+            raise SerializationError("Failed to deserialize Task array from JSON",
+                                   data_type="Task", operation="from_json_array", original_exception=e)
+
     @classmethod
     def create_new(cls, description: str, parameters: Dict[str, Any], 
                    priority: int = 1, deadline: Optional[datetime] = None,
                    context: Optional[Dict[str, Any]] = None) -> 'Task':
         """Create a new task with auto-generated ID"""
         return cls(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             description=description,
             parameters=parameters,
             priority=priority,
@@ -129,8 +496,8 @@ class Task:
         )
 
 
-@dataclass
-class TaskResult:
+@_validated_dataclass
+class TaskResult(_ValidatedModel):
     """Data model for task execution results"""
     task_id: str
     status: TaskStatus
@@ -139,62 +506,74 @@ class TaskResult:
     confidence_score: float
     sources_used: List[str]
 
-    def __post_init__(self):
-        self.validate()
-
-    def validate(self) -> None:
-        """Validate task result data"""
-        if not self.task_id or not isinstance(self.task_id, str):
-            raise DataValidationError("Task ID must be a non-empty string",
-                                    field_name="task_id", field_value=self.task_id, model_type="TaskResult")
-        
-        if not isinstance(self.status, TaskStatus):
-            raise DataValidationError("Status must be a TaskStatus enum value",
-                                    field_name="status", field_value=type(self.status).__name__, model_type="TaskResult")
+    _CHECKS = [
+        ('task_id', 'not v or type(v) is not str and not isinstance(v, str)',
+         "Task ID must be a non-empty string", 'value'),
+        ('status', 'type(v) is not TaskStatus',
+         "Status must be a TaskStatus enum value", 'type'),
+        ('result_data', 'type(v) is not dict and not isinstance(v, dict)',
+         "Result data must be a dictionary", 'type'),
+        ('execution_time', 'not isinstance(v, (int, float)) or v < 0',
+         "Execution time must be a non-negative number", 'value'),
+        ('confidence_score', 'not isinstance(v, (int, float)) or not (0 <= v <= 1)',
+         "Confidence score must be a number between 0 and 1", 'value'),
+        ('sources_used', 'type(v) is not list and not isinstance(v, list)',
+         "Sources used must be a list", 'type'),
+        ('sources_used', 'not all(type(source) is str or isinstance(source, str) for source in v)',
+         "All sources must be strings", 'mixed'),
+    ]
+
+    def to_mapping(self) -> Dict[str, Any]:
+        """
+        Convert task result to a dictionary of native field values
         
-        if not isinstance(self.result_data, dict):
-            raise DataValidationError("Result data must be a dictionary",
-                                    field_name="result_data", field_value=type(self.result_data).__name__, model_type="TaskResult")
+        Unlike ``to_dict``, ``status`` stays a TaskStatus, so records passed
+        between components in-process skip a format/parse round trip. Nested
+        containers are shared with the task result.
+        """
+        return {
+            'task_id': self.task_id,
+            'status': self.status,
+            'result_data': self.result_data,
+            'execution_time': self.execution_time,
+            'confidence_score': self.confidence_score,
+            'sources_used': self.sources_used
+        }
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert task result to dictionary for serialization
         
-        if not isinstance(self.execution_time, (int, float)) or self.execution_time < 0:
-            raise DataValidationError("Execution time must be a non-negative number",
-                                    field_name="execution_time", field_value=self.execution_time, model_type="TaskResult")
-        
-        if not isinstance(self.confidence_score, (int, float)) or not (0 <= self.confidence_score <= 1):
-            raise DataValidationError("Confidence score must be a number between 0 and 1",
-                                    field_name="confidence_score", field_value=self.confidence_score, model_type="TaskResult")
-        
-        if not isinstance(self.sources_used, list):
-            raise DataValidationError("Sources used must be a list",
-                                    field_name="sources_used", field_value=type(self.sources_used).__name__, model_type="TaskResult")
-        
-        if not all(isinstance(source, str) for source in self.sources_used):
-            raise DataValidationError("All sources must be strings",
-                                    field_name="sources_used", field_value="mixed types", model_type="TaskResult")
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert task result to dictionary for serialization"""
-        data = asdict(self)
-        data['status'] = self.status.value
-        return data
+        The nested ``result_data`` and ``sources_used`` are returned by
+        reference and must be treated as read-only unless ``copy`` is True.
+        """
+        data = {
+            'task_id': self.task_id,
+            'status': self.status.value,
+            'result_data': self.result_data,
+            'execution_time': self.execution_time,
+            'confidence_score': self.confidence_score,
+            'sources_used': self.sources_used
+        }
+        return deepcopy(data) if copy else data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TaskResult':
-        """Create task result from dictionary"""
-        data['status'] = TaskStatus(data['status'])
+        """Create task result from dictionary (converts fields of ``data`` in place)"""
+        data['status'] = _enum_member(_STATUS_LOOKUP, TaskStatus, data['status'], 'status', 'TaskResult')
         return cls(**data)
 
     def to_json(self) -> str:
         """Convert task result to JSON string"""
-        return json.dumps(self.to_dict())
+        return fast_json_dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'TaskResult':
-        """Create task result from JSON string"""
+        """Create task result from JSON string (invalid data raises SerializationError)"""
         try:
-            data = json.loads(json_str)
+            data = fast_json_loads(json_str)
             return cls.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
             raise SerializationError("Failed to deserialize TaskResult from JSON",
                                    data_type="TaskResult", operation="from_json", original_exception=e)
 
@@ -207,8 +586,8 @@ class TaskResult:
         return self.status == TaskStatus.FAILED
 
 
-@dataclass
-class MemoryEntry:
+@_validated_dataclass
+class MemoryEntry(_ValidatedModel):
     """Data model for memory storage entries"""
     id: str
     content: Dict[str, Any]
@@ -217,64 +596,77 @@ class MemoryEntry:
     relevance_score: float
     tags: List[str]
 
-    def __post_init__(self):
-        self.validate()
-
-    def validate(self) -> None:
-        """Validate memory entry data"""
-        if not self.id or not isinstance(self.id, str):
-            raise DataValidationError("Memory entry ID must be a non-empty string",
-                                    field_name="id", field_value=self.id, model_type="MemoryEntry")
-        
-        if not isinstance(self.content, dict):
-            raise DataValidationError("Memory content must be a dictionary",
-                                    field_name="content", field_value=type(self.content).__name__, model_type="MemoryEntry")
-        
-        if not isinstance(self.timestamp, datetime):
-            raise DataValidationError("Timestamp must be a datetime object",
-                                    field_name="timestamp", field_value=type(self.timestamp).__name__, model_type="MemoryEntry")
+    _CHECKS = [
+        ('id', 'not v or type(v) is not str and not isinstance(v, str)',
+         "Memory entry ID must be a non-empty string", 'value'),
+        ('content', 'type(v) is not dict and not isinstance(v, dict)',
+         "Memory content must be a dictionary", 'type'),
+        ('timestamp', 'type(v) is not datetime and not isinstance(v, datetime)',
+         "Timestamp must be a datetime object", 'type'),
+        ('memory_type', 'type(v) is not MemoryType',
+         "Memory type must be a MemoryType enum value", 'type'),
+        ('relevance_score', 'not isinstance(v, (int, float)) or not (0 <= v <= 1)',
+         "Relevance score must be a number between 0 and 1", 'value'),
+        ('tags', 'type(v) is not list and not isinstance(v, list)',
+         "Tags must be a list", 'type'),
+        ('tags', 'not all(type(tag) is str or isinstance(tag, str) for tag in v)',
+         "All tags must be strings", 'mixed'),
+    ]
+
+    def to_mapping(self) -> Dict[str, Any]:
+        """
+        Convert memory entry to a dictionary of native field values
         
-        if not isinstance(self.memory_type, MemoryType):
-            raise DataValidationError("Memory type must be a MemoryType enum value",
-                                    field_name="memory_type", field_value=type(self.memory_type).__name__, model_type="MemoryEntry")
+        Unlike ``to_dict``, ``timestamp`` and ``memory_type`` keep their
+        types, so records passed between components in-process skip a
+        format/parse round trip. Nested containers are shared with the memory
+        entry.
+        """
+        return {
+            'id': self.id,
+            'content': self.content,
+            'timestamp': self.timestamp,
+            'memory_type': self.memory_type,
+            'relevance_score': self.relevance_score,
+            'tags': self.tags
+        }
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert memory entry to dictionary for serialization
         
-        if not isinstance(self.relevance_score, (int, float)) or not (0 <= self.relevance_score <= 1):
-            raise DataValidationError("Relevance score must be a number between 0 and 1",
-                                    field_name="relevance_score", field_value=self.relevance_score, model_type="MemoryEntry")
-        
-        if not isinstance(self.tags, list):
-            raise DataValidationError("Tags must be a list",
-                                    field_name="tags", field_value=type(self.tags).__name__, model_type="MemoryEntry")
-        
-        if not all(isinstance(tag, str) for tag in self.tags):
-            raise DataValidationError("All tags must be strings",
-                                    field_name="tags", field_value="mixed types", model_type="MemoryEntry")
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert memory entry to dictionary for serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['memory_type'] = self.memory_type.value
-        return data
+        The nested ``content`` and ``tags`` are returned by reference and must be
+        treated as read-only unless ``copy`` is True.
+        """
+        data = {
+            'id': self.id,
+            'content': self.content,
+            'timestamp': self.timestamp.isoformat(),
+            'memory_type': self.memory_type.value,
+            'relevance_score': self.relevance_score,
+            'tags': self.tags
+        }
+        return deepcopy(data) if copy else data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MemoryEntry':
-        """Create memory entry from dictionary"""
+        """Create memory entry from dictionary (converts fields of ``data`` in place)"""
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        data['memory_type'] = MemoryType(data['memory_type'])
+        data['memory_type'] = _enum_member(_MEMORY_TYPE_LOOKUP, MemoryType, data['memory_type'],
+                                           'memory_type', 'MemoryEntry')
         return cls(**data)
 
     def to_json(self) -> str:
         """Convert memory entry to JSON string"""
-        return json.dumps(self.to_dict())
+        return fast_json_dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'MemoryEntry':
-        """Create memory entry from JSON string"""
+        """Create memory entry from JSON string (invalid data raises SerializationError)"""
         try:
-            data = json.loads(json_str)
+            data = fast_json_loads(json_str)
             return cls.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
             raise SerializationError("Failed to deserialize MemoryEntry from JSON",
                                    data_type="MemoryEntry", operation="from_json", original_exception=e)
 
@@ -283,7 +675,7 @@ class MemoryEntry:
                    relevance_score: float = 0.5, tags: Optional[List[str]] = None) -> 'MemoryEntry':
         """Create a new memory entry with auto-generated ID and current timestamp"""
         return cls(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             content=content,
             timestamp=datetime.now(),
             memory_type=memory_type,
@@ -296,143 +688,198 @@ class MemoryEntry:
         if tag not in self.tags:
             self.tags.append(tag)
 
+    def add_tags(self, tags: List[str]) -> None:
+        """Add several tags, skipping duplicates, with one membership set for the batch"""
+        seen = set(self.tags)
+        for tag in tags:
+            if tag not in seen:
+                seen.add(tag)
+                self.tags.append(tag)
+
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the memory entry"""
-        if tag in self.tags:
+        try:
             self.tags.remove(tag)
+        except ValueError:
+            pass
 
 
-@dataclass
-class BrowserAction:
-    """Data model for browser actions"""
+@_validated_dataclass
+class BrowserAction(_ValidatedModel):
+    """
+    Data model for browser actions
+    
+    Browser actions are frozen and the create_* helpers return cached
+    instances for repeated arguments, with ``parameters`` as a read-only
+    dict so a shared instance cannot be changed through it. Hashing
+    ignores ``parameters``.
+    """
     action_type: ActionType
     target: str
-    parameters: Dict[str, Any]
+    parameters: Mapping[str, Any] = field(hash=False)
     expected_outcome: str
 
-    def __post_init__(self):
-        self.validate()
-
-    def validate(self) -> None:
-        """Validate browser action data"""
-        if not isinstance(self.action_type, ActionType):
-            raise DataValidationError("Action type must be an ActionType enum value",
-                                    field_name="action_type", field_value=type(self.action_type).__name__, model_type="BrowserAction")
-        
-        if not self.target or not isinstance(self.target, str):
-            raise DataValidationError("Target must be a non-empty string",
-                                    field_name="target", field_value=self.target, model_type="BrowserAction")
-        
-        if not isinstance(self.parameters, dict):
-            raise DataValidationError("Parameters must be a dictionary",
-                                    field_name="parameters", field_value=type(self.parameters).__name__, model_type="BrowserAction")
-        
-        if not isinstance(self.expected_outcome, str):
-            raise DataValidationError("Expected outcome must be a string",
-                                    field_name="expected_outcome", field_value=type(self.expected_outcome).__name__, model_type="BrowserAction")
+    _CHECKS = [
+        ('action_type', 'type(v) is not ActionType',
+         "Action type must be an ActionType enum value", 'type'),
+        ('target', 'not v or type(v) is not str and not isinstance(v, str)',
+         "Target must be a non-empty string", 'value'),
+        ('parameters', 'type(v) is not dict and not isinstance(v, dict)',
+         "Parameters must be a dictionary", 'type'),
+        ('expected_outcome', 'type(v) is not str and not isinstance(v, str)',
+         "Expected outcome must be a string", 'type'),
+    ]
+    # Action-specific parameters
+    _DISPATCH_CHECKS = ('_ACTION_PARAMETER_CHECKS[action_type](parameters)',)
+    # Set by the create_* helpers, which already know the action type
+    _TRUSTED_FIELDS = ('action_type', 'parameters')
+    _FROZEN = True
+
+    def to_mapping(self) -> Dict[str, Any]:
+        """
+        Convert browser action to a dictionary of native field values
         
-        # Validate action-specific parameters
-        if self.action_type == ActionType.CLICK:
-            # Click actions should have selector or coordinates
-            if 'selector' not in self.parameters and 'coordinates' not in self.parameters:
-                raise DataValidationError("Click action must have either 'selector' or 'coordinates' parameter",
-                                        field_name="parameters", field_value=list(self.parameters.keys()), model_type="BrowserAction")
+        Unlike ``to_dict``, ``action_type`` stays an ActionType, so records
+        passed between components in-process skip a format/parse round trip.
+        Nested containers are shared with the browser action.
+        """
+        return {
+            'action_type': self.action_type,
+            'target': self.target,
+            'parameters': self.parameters,
+            'expected_outcome': self.expected_outcome
+        }
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Convert browser action to dictionary for serialization
         
-        elif self.action_type == ActionType.TYPE:
-            # Type actions should have text to type
-            if 'text' not in self.parameters:
-                raise DataValidationError("Type action must have 'text' parameter",
-                                        field_name="parameters", field_value=list(self.parameters.keys()), model_type="BrowserAction")
-        
-        elif self.action_type == ActionType.SCROLL:
-            # Scroll actions should have direction and amount
-            if 'direction' not in self.parameters:
-                raise DataValidationError("Scroll action must have 'direction' parameter",
-                                        field_name="parameters", field_value=list(self.parameters.keys()), model_type="BrowserAction")
-        
-        elif self.action_type == ActionType.WAIT:
-            # Wait actions should have timeout
-            if 'timeout' not in self.parameters:
-                raise DataValidationError("Wait action must have 'timeout' parameter",
-                                        field_name="parameters", field_value=list(self.parameters.keys()), model_type="BrowserAction")
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert browser action to dictionary for serialization"""
-        data = asdict(self)
-        data['action_type'] = self.action_type.value
-        return data
+        ``parameters`` is returned as a new dict, but the values in it are
+        shared and must be treated as read-only unless ``copy`` is True.
+        """
+        data = {
+            'action_type': self.action_type.value,
+            'target': self.target,
+            'parameters': dict(self.parameters),
+            'expected_outcome': self.expected_outcome
+        }
+        return deepcopy(data) if copy else data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BrowserAction':
-        """Create browser action from dictionary"""
-        data['action_type'] = ActionType(data['action_type'])
+        """Create browser action from dictionary (converts fields of ``data`` in place)"""
+        data['action_type'] = _enum_member(_ACTION_TYPE_LOOKUP, ActionType, data['action_type'],
+                                           'action_type', 'BrowserAction')
         return cls(**data)
 
     def to_json(self) -> str:
         """Convert browser action to JSON string"""
-        return json.dumps(self.to_dict())
+        return fast_json_dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'BrowserAction':
-        """Create browser action from JSON string"""
+        """Create browser action from JSON string (invalid data raises SerializationError)"""
         try:
-            data = json.loads(json_str)
+            data = fast_json_loads(json_str)
             return cls.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
             raise SerializationError("Failed to deserialize BrowserAction from JSON",
                                    data_type="BrowserAction", operation="from_json", original_exception=e)
 
+    @staticmethod
+    def to_json_array(items: List['BrowserAction']) -> str:
+        """Convert a list of browser actions to one JSON array string"""
+        return fast_json_dumps([item.to_dict() for item in items])
+
     @classmethod
+    def from_json_array(cls, json_str: str) -> List['BrowserAction']:
+        """
+        Create browser actions from a JSON array string, parsed in one pass
+        
+        Invalid JSON or an invalid item raises SerializationError.
+        """
+        try:
+            items = fast_json_loads(json_str)
+            if not isinstance(items, list):
+                raise TypeError(f"expected a JSON array, got {type(items).__name__}")
+            from_dict = cls.from_dict
+            return [from_dict(data) for data in items]
+        except (json.JSONDecodeError, KeyError, TypeError, DataValidationError) as e:
+            raise SerializationError("Failed to deserialize BrowserAction array from JSON",
+                                   data_type="BrowserAction", operation="from_json_array", original_exception=e)
+
+    @classmethod
+    @_memoized_factory
     def create_click(cls, target: str, selector: str = None, coordinates: tuple = None,
                      expected_outcome: str = "Element clicked") -> 'BrowserAction':
         """Create a click action"""
         parameters = {}
         if selector:
-            parameters['selector'] = selector
+            parameters[_SELECTOR] = selector
         if coordinates:
-            parameters['coordinates'] = coordinates
+            parameters[_COORDINATES] = coordinates
         
-        return cls(
+        action = cls._new_trusted(
             action_type=ActionType.CLICK,
             target=target,
-            parameters=parameters,
+            parameters=_FrozenDict(parameters),
             expected_outcome=expected_outcome
         )
+        _check_click_parameters(parameters)
+        return action
 
     @classmethod
+    @_memoized_factory
     def create_type(cls, target: str, text: str, 
                     expected_outcome: str = "Text entered") -> 'BrowserAction':
         """Create a type action"""
-        return cls(
+        return cls._new_trusted(
             action_type=ActionType.TYPE,
             target=target,
-            parameters={'text': text},
+            parameters=_FrozenDict({_TEXT: text}),
             expected_outcome=expected_outcome
         )
 
     @classmethod
+    @_memoized_factory
     def create_scroll(cls, target: str, direction: str, amount: int = 1,
                       expected_outcome: str = "Page scrolled") -> 'BrowserAction':
         """Create a scroll action"""
-        return cls(
+        return cls._new_trusted(
             action_type=ActionType.SCROLL,
             target=target,
-            parameters={'direction': direction, 'amount': amount},
+            parameters=_FrozenDict({_DIRECTION: direction, _AMOUNT: amount}),
             expected_outcome=expected_outcome
         )
 
     @classmethod
+    @_memoized_factory
     def create_wait(cls, target: str, timeout: int = 10,
                     expected_outcome: str = "Element appeared") -> 'BrowserAction':
         """Create a wait action"""
-        return cls(
+        return cls._new_trusted(
             action_type=ActionType.WAIT,
             target=target,
-            parameters={'timeout': timeout},
+            parameters=_FrozenDict({_TIMEOUT: timeout}),
             expected_outcome=expected_outcome
         )
 
 
+def top_results_by_confidence(results: List[TaskResult], k: int) -> List[TaskResult]:
+    """
+    Return the ``k`` task results with the highest confidence score
+    
+    Equivalent to ``sorted(results, key=..., reverse=True)[:k]`` (ties keep
+    their input order) but runs in O(n log k) without sorting the full list.
+    """
+    return heapq.nlargest(k, results, key=attrgetter('confidence_score'))
+
+
+def top_memories_by_relevance(entries: List[MemoryEntry], k: int) -> List[MemoryEntry]:
+    """Return the ``k`` memory entries with the highest relevance score"""
+    return heapq.nlargest(k, entries, key=attrgetter('relevance_score'))
+
+
 class IMemorySystem(ABC):
     """Interface for memory system implementations"""
     
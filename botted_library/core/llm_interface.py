@@ -4,9 +4,18 @@ LLM Interface for Botted Library
 Provides integration with various LLM providers for intelligent decision making.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from functools import partial
+from itertools import islice
+from operator import mul
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -14,6 +23,9 @@ from .exceptions import BottedLibraryError
 from ..utils.logger import setup_logger
 
 
+CODE_GENERATION_INSTRUCTIONS = "Please generate clean, well-documented code that meets the requirements below."
+
+
 class LLMError(BottedLibraryError):
     """LLM-related errors"""
     pass
@@ -22,6 +34,8 @@ class LLMError(BottedLibraryError):
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def generate_response(self, prompt: str, context: Dict[str, Any] = None) -> str:
         """Generate a response from the LLM"""
@@ -31,11 +45,35 @@ class LLMProvider(ABC):
     def generate_structured_response(self, prompt: str, schema: Dict[str, Any], context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Generate a structured response matching the given schema"""
         pass
+    
+    async def agenerate_response(self, prompt: str, context: Dict[str, Any] = None) -> str:
+        """
+        Generate a response without blocking the event loop
+        
+        The default runs generate_response in the loop's executor; providers
+        with a native async client should override this.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.generate_response, prompt, context))
 
 
 class MockLLMProvider(LLMProvider):
     """Mock LLM provider for testing and development"""
     
+    # __dict__ is lazily allocated; keeps patch.object() on instances working
+    __slots__ = ('config', 'logger', '__dict__', '__weakref__')
+    
+    # Canned responses in precedence order, with the keywords that select them
+    _RESPONSES = (
+        (('edit', 'grammar'), "I have analyzed the text and made improvements to grammar, clarity, and style."),
+        (('research', 'find'), "Based on my research from reliable sources, I have gathered comprehensive information on the requested topic."),
+        (('email', 'categorize'), "I have processed and categorized the emails based on priority and content type."),
+        (('code', 'program'), "I have analyzed the requirements and created a well-structured code solution."),
+    )
+    _KEYWORD_RANK = {keyword: rank for rank, (keywords, _) in enumerate(_RESPONSES) for keyword in keywords}
+    # Lookahead so overlapping keywords (e.g. "codedit") are all seen in one scan
+    _KEYWORD_PATTERN = re.compile(f"(?=({'|'.join(_KEYWORD_RANK)}))", re.IGNORECASE | re.ASCII)
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.logger = setup_logger(__name__)
@@ -45,16 +83,17 @@ class MockLLMProvider(LLMProvider):
         role = context.get('role', 'assistant') if context else 'assistant'
         
         # Generate contextual mock responses based on role and prompt
-        if 'edit' in prompt.lower() or 'grammar' in prompt.lower():
-            return "I have analyzed the text and made improvements to grammar, clarity, and style."
-        elif 'research' in prompt.lower() or 'find' in prompt.lower():
-            return "Based on my research from reliable sources, I have gathered comprehensive information on the requested topic."
-        elif 'email' in prompt.lower() or 'categorize' in prompt.lower():
-            return "I have processed and categorized the emails based on priority and content type."
-        elif 'code' in prompt.lower() or 'program' in prompt.lower():
-            return "I have analyzed the requirements and created a well-structured code solution."
-        else:
-            return f"As a {role}, I have processed your request and completed the task according to best practices."
+        best_rank = None
+        for match in self._KEYWORD_PATTERN.finditer(prompt):
+            rank = self._KEYWORD_RANK[match.group(1).lower()]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        
+        if best_rank is not None:
+            return self._RESPONSES[best_rank][1]
+        return f"As a {role}, I have processed your request and completed the task according to best practices."
     
     def generate_structured_response(self, prompt: str, schema: Dict[str, Any], context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Generate mock structured response"""
@@ -82,25 +121,102 @@ class MockLLMProvider(LLMProvider):
 class LLMInterface:
     """Main interface for LLM operations"""
     
-    def __init__(self, provider: LLMProvider, config: Dict[str, Any] = None):
+    __slots__ = (
+        'provider', 'config', 'logger', 'embed_fn',
+        'max_history', 'conversation_history', 'history_messages',
+        '_history_tail', '_history_messages_tail', '_history_key',
+        '_response_cache', 'response_cache_size',
+        '_semantic_cache', 'semantic_threshold',
+        # Lazily allocated; keeps patch.object() on instances working
+        '__dict__', '__weakref__',
+    )
+    
+    def __init__(self, provider: LLMProvider, config: Dict[str, Any] = None,
+                 embed_fn: Optional[Callable[[str], Sequence[float]]] = None):
+        """
+        Args:
+            provider: LLM provider that generates the responses
+            config: Interface configuration
+            embed_fn: Optional prompt embedding function; when given, think()
+                also answers prompts whose embedding is close enough to an
+                earlier prompt's from the semantic cache
+        """
         self.provider = provider
         self.config = config or {}
         self.logger = setup_logger(__name__)
+        self.embed_fn = embed_fn
         
         # Conversation history for context
-        self.conversation_history: List[Dict[str, Any]] = []
         self.max_history = self.config.get('max_conversation_history', 10)
+        self.conversation_history: 'deque[Dict[str, Any]]' = deque(maxlen=self.max_history)
+        # The same exchanges as chat messages, ready to send as-is
+        self.history_messages: 'deque[Dict[str, str]]' = deque(maxlen=2 * self.max_history)
+        # Recent history as sent to the provider, rebuilt only when it changes
+        self._history_tail: Tuple[Dict[str, Any], ...] = ()
+        self._history_messages_tail: Tuple[Dict[str, str], ...] = ()
+        # JSON of the history messages tail, part of every cache key
+        self._history_key = '[]'
+        
+        # think() responses keyed by a digest of (prompt, context, history),
+        # least recently used first; off unless response_cache_size is set
+        self._response_cache: 'OrderedDict[bytes, str]' = OrderedDict()
+        self.response_cache_size = self.config.get('response_cache_size', 0)
+        
+        # (context and history key, unit prompt embedding, response) for the
+        # most recent prompts, searched linearly; used only with an embed_fn
+        self._semantic_cache: 'deque[Tuple[str, Tuple[float, ...], str]]' = deque(
+            maxlen=self.config.get('semantic_cache_size', 256)
+        )
+        self.semantic_threshold = self.config.get('semantic_cache_threshold', 0.95)
     
     def think(self, prompt: str, context: Dict[str, Any] = None) -> str:
-        """Generate a thoughtful response to a prompt"""
+        """
+        Generate a thoughtful response to a prompt
+        
+        With config['response_cache_size'] set, responses are cached by
+        prompt, caller context and the recent conversation history sent with
+        the prompt, when the context is plain JSON. With an embed_fn, a
+        prompt whose embedding has cosine similarity of at least
+        config['semantic_cache_threshold'] (default 0.95) to a cached prompt
+        with the same context and history is answered from the cache too.
+        """
         try:
+            context_json = self._context_json(context)
+            cache_context = None
+            if context_json is not None:
+                cache_context = f"{context_json}\x00{self._history_key}"
+            
+            cache_key = None
+            if cache_context is not None and self.response_cache_size > 0:
+                cache_key = self._response_cache_key(prompt, cache_context)
+                response = self._response_cache.get(cache_key)
+                if response is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    self._add_to_history(prompt, response)
+                    return response
+            
+            embedding = None
+            if cache_context is not None and self.embed_fn is not None:
+                embedding = self._embed(prompt)
+                response = self._semantic_match(embedding, cache_context)
+                if response is not None:
+                    self._add_to_history(prompt, response)
+                    return response
+            
             # Add conversation history to context
-            full_context = context or {}
-            if self.conversation_history:
-                full_context['conversation_history'] = self.conversation_history[-5:]
+            full_context = self._with_history(
+                context, self._history_tail, self._history_messages_tail, prompt
+            )
             
             response = self.provider.generate_response(prompt, full_context)
             
+            if cache_key is not None:
+                self._response_cache[cache_key] = response
+                if len(self._response_cache) > self.response_cache_size:
+                    self._response_cache.popitem(last=False)
+            if embedding is not None:
+                self._semantic_cache.append((cache_context, embedding, response))
+            
             # Store in conversation history
             self._add_to_history(prompt, response)
             
@@ -110,15 +226,82 @@ class LLMInterface:
             self.logger.error(f"LLM thinking error: {str(e)}")
             raise LLMError(f"Failed to generate response: {str(e)}", original_exception=e)
     
+    async def abatch_think(self, prompts: List[str],
+                           contexts: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[Union[str, LLMError]]:
+        """
+        Generate responses to several prompts concurrently
+        
+        At most config['max_concurrency'] (default 8) requests are in flight
+        at once. Every prompt sees the conversation history as it was when
+        the batch started; successful exchanges are added to the history
+        afterwards, in prompt order.
+        
+        Args:
+            prompts: Prompts to answer
+            contexts: Optional context per prompt, parallel to ``prompts``
+            
+        Returns:
+            The response for each prompt, or an LLMError in the slot of a
+            prompt that failed
+            
+        Raises:
+            asyncio.CancelledError: If any request was cancelled; the
+                history is left unchanged
+        """
+        if contexts is None:
+            contexts = [None] * len(prompts)
+        if len(contexts) != len(prompts):
+            raise LLMError("abatch_think needs one context per prompt")
+        
+        history = self._history_tail
+        history_messages = self._history_messages_tail
+        semaphore = asyncio.Semaphore(self.config.get('max_concurrency', 8))
+        
+        async def generate(prompt: str, context: Optional[Dict[str, Any]]) -> str:
+            full_context = self._with_history(context, history, history_messages, prompt)
+            async with semaphore:
+                return await self.provider.agenerate_response(prompt, full_context)
+        
+        results = await asyncio.gather(
+            *(generate(prompt, context) for prompt, context in zip(prompts, contexts)),
+            return_exceptions=True
+        )
+        
+        responses: List[Union[str, LLMError]] = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                responses.append(result)
+            elif isinstance(result, Exception):
+                self.logger.error(f"LLM thinking error: {str(result)}")
+                responses.append(LLMError(f"Failed to generate response: {str(result)}", original_exception=result))
+            else:
+                # Cancellation is not a per-prompt failure; propagate it
+                # before anything is added to the history
+                raise result
+        
+        for prompt, response in zip(prompts, responses):
+            if isinstance(response, str):
+                self._add_to_history(prompt, response)
+        
+        return responses
+    
     def generate_code(self, requirements: str, language: str = "python", context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate code based on requirements"""
+        """
+        Generate code based on requirements
+        
+        The prompt starts with its fixed instructions and ends with the
+        requirements, and the instructions are also passed as
+        context['system'] (unless the caller set one), so providers with
+        prompt caching can reuse the shared prefix across requests.
+        """
         try:
             code_prompt = f"""
-            Requirements: {requirements}
+            {CODE_GENERATION_INSTRUCTIONS}
             Language: {language}
-            
-            Please generate clean, well-documented code that meets these requirements.
+            ---
+            Requirements: {requirements}
             """
+            context = {'system': CODE_GENERATION_INSTRUCTIONS, **(context or {})}
             
             schema = {
                 'code': 'string',
@@ -140,18 +323,105 @@ class LLMInterface:
     def _add_to_history(self, prompt: str, response: str) -> None:
         """Add exchange to conversation history"""
         self.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'ts_ns': time.time_ns(),
             'prompt': prompt,
             'response': response
         })
+        self.history_messages.append({'role': 'user', 'content': prompt})
+        self.history_messages.append({'role': 'assistant', 'content': response})
+        
+        self._history_tail = self._tail(self.conversation_history, 5)
+        self._history_messages_tail = self._tail(self.history_messages, 10)
+        self._history_key = json.dumps(self._history_messages_tail)
+    
+    @staticmethod
+    def history_timestamp(entry: Dict[str, Any]) -> str:
+        """ISO timestamp of a conversation_history entry"""
+        return datetime.fromtimestamp(entry['ts_ns'] / 1e9).isoformat()
+    
+    @staticmethod
+    def _tail(items: 'deque', count: int) -> Tuple[Any, ...]:
+        """Last ``count`` items of a deque as a tuple"""
+        return tuple(islice(items, max(0, len(items) - count), None))
+    
+    @staticmethod
+    def _with_history(context: Optional[Dict[str, Any]], history: Tuple[Dict[str, Any], ...],
+                      history_messages: Tuple[Dict[str, str], ...], prompt: str) -> Dict[str, Any]:
+        """
+        Copy of a context with the recent conversation added
         
-        # Maintain history size limit
-        if len(self.conversation_history) > self.max_history:
-            self.conversation_history = self.conversation_history[-self.max_history:]
+        Besides 'conversation_history', the context gets 'messages': the
+        system text (context['system'], if any), then earlier exchanges, then
+        the prompt as the final user message, so providers with prompt
+        caching keep a stable prefix. 'cache_breakpoint' is the index of the
+        last message that will also start the next request.
+        """
+        full_context = dict(context or {})
+        if history:
+            full_context['conversation_history'] = history
+        
+        messages = []
+        if full_context.get('system'):
+            messages.append({'role': 'system', 'content': full_context['system']})
+        messages.extend(history_messages)
+        messages.append({'role': 'user', 'content': prompt})
+        full_context['messages'] = messages
+        if len(messages) > 1:
+            full_context['cache_breakpoint'] = len(messages) - 2
+        return full_context
+    
+    @staticmethod
+    def _context_json(context: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Canonical JSON for a context, or None if it cannot be serialized
+        
+        Values that are not plain JSON make the context uncacheable rather
+        than falling back to repr(), which can collide for distinct objects
+        or differ between equal ones.
+        """
+        try:
+            return json.dumps(context, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _response_cache_key(prompt: str, cache_context: str) -> bytes:
+        """Digest of a prompt and its context and history key"""
+        return hashlib.blake2b(f"{prompt}\x00{cache_context}".encode(), digest_size=16).digest()
+    
+    def _embed(self, prompt: str) -> Optional[Tuple[float, ...]]:
+        """Unit-length embedding of a prompt, or None for a zero vector"""
+        vector = [float(x) for x in self.embed_fn(prompt)]
+        norm = math.sqrt(sum(map(mul, vector, vector)))
+        if not norm:
+            return None
+        return tuple(x / norm for x in vector)
+    
+    def _semantic_match(self, embedding: Optional[Tuple[float, ...]], cache_context: str) -> Optional[str]:
+        """Response of the most similar cached prompt above the threshold"""
+        if embedding is None:
+            return None
+        best_response = None
+        best_score = self.semantic_threshold
+        for cached_context, cached_embedding, response in self._semantic_cache:
+            if cached_context == cache_context:
+                score = sum(map(mul, embedding, cached_embedding))
+                if score >= best_score:
+                    best_response, best_score = response, score
+        return best_response
     
     def clear_history(self) -> None:
         """Clear conversation history"""
         self.conversation_history.clear()
+        self.history_messages.clear()
+        self._history_tail = ()
+        self._history_messages_tail = ()
+        self._history_key = '[]'
+    
+    def clear_response_cache(self) -> None:
+        """Clear cached think() responses, including the semantic cache"""
+        self._response_cache.clear()
+        self._semantic_cache.clear()
 
 
 def create_llm_interface(provider_type: str = "gemini", **kwargs) -> LLMInterface:
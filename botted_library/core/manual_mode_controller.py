@@ -7,13 +7,48 @@ and collaborative space management in manual mode.
 
 import uuid
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Set
 
 from .enhanced_worker_registry import WorkerType
 from .exceptions import WorkerError
 
 
+_logger = logging.getLogger(__name__)
+
+# Worker class for each worker type, as (module, class name)
+_WORKER_CLASSES = {
+    WorkerType.PLANNER: ('planner_worker', 'PlannerWorker'),
+    WorkerType.EXECUTOR: ('executor_worker', 'ExecutorWorker'),
+    WorkerType.VERIFIER: ('verifier_worker', 'VerifierWorker'),
+}
+
+_worker_modules = None
+
+
+def _load_worker_modules():
+    """
+    Import the worker modules on first use.
+    
+    They import this package, so they cannot be imported at module load.
+    Classes are read from the modules at call time, so patching them
+    (e.g. in tests) still takes effect.
+    """
+    global _worker_modules
+    if _worker_modules is None:
+        from . import planner_worker, executor_worker, verifier_worker, enhanced_worker
+        _worker_modules = {
+            'planner_worker': planner_worker,
+            'executor_worker': executor_worker,
+            'verifier_worker': verifier_worker,
+            'enhanced_worker': enhanced_worker,
+        }
+    return _worker_modules
+
+
 class ManualModeController:
     """
     Controller for manual mode operations where users directly control
@@ -26,6 +61,14 @@ class ManualModeController:
     - Coordinating worker interactions
     """
     
+    __slots__ = (
+        'server', 'config', 'controller_id', 'logger',
+        'manual_workers', 'manual_spaces', 'manual_tasks',
+        '_tasks_by_status', '_tasks_lock', '_task_pool', 'ui_callbacks', 'stats',
+        # Lazily allocated; keeps patch.object() on instances working
+        '__dict__', '__weakref__',
+    )
+    
     def __init__(self, server_instance, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the manual mode controller.
@@ -36,15 +79,21 @@ class ManualModeController:
         """
         self.server = server_instance
         self.config = config or {}
-        self.controller_id = str(uuid.uuid4())
+        self.controller_id = uuid.uuid4().hex
         
         # Setup logging
-        self.logger = logging.getLogger(f"ManualModeController.{self.controller_id[:8]}")
+        self.logger = _logger.getChild(self.controller_id[:8])
         
         # Track manual operations
         self.manual_workers: Dict[str, Dict[str, Any]] = {}
         self.manual_spaces: Dict[str, Dict[str, Any]] = {}
         self.manual_tasks: Dict[str, Dict[str, Any]] = {}
+        # Task IDs grouped by their current manual_tasks status
+        self._tasks_by_status: Dict[str, Set[str]] = defaultdict(set)
+        # Guards manual_tasks and _tasks_by_status against the task pool threads
+        self._tasks_lock = threading.Lock()
+        # Runs tasks in the background when config['async_tasks'] is set
+        self._task_pool: Optional[ThreadPoolExecutor] = None
         
         # User interface callbacks
         self.ui_callbacks: Dict[str, Callable] = {}
@@ -57,7 +106,7 @@ class ManualModeController:
             'operations_performed': 0
         }
         
-        self.logger.info(f"ManualModeController initialized with ID: {self.controller_id[:8]}")
+        self.logger.info("ManualModeController initialized with ID: %s", self.controller_id[:8])
     
     def create_worker_manually(self, worker_type: WorkerType, name: str, role: str,
                              capabilities: Optional[List[str]] = None,
@@ -79,20 +128,16 @@ class ManualModeController:
             WorkerError: If worker creation fails
         """
         try:
-            # Import worker classes here to avoid circular imports
-            from .planner_worker import PlannerWorker
-            from .executor_worker import ExecutorWorker
-            from .verifier_worker import VerifierWorker
-            from .enhanced_worker import ServerConnection
+            worker_modules = _load_worker_modules()
             
             # Generate worker ID
-            worker_id = str(uuid.uuid4())
+            worker_id = uuid.uuid4().hex
             
             # Create server connection
-            server_connection = ServerConnection(
+            server_connection = worker_modules['enhanced_worker'].ServerConnection(
                 server_instance=self.server,
                 worker_id=worker_id,
-                connection_id=str(uuid.uuid4()),
+                connection_id=uuid.uuid4().hex,
                 connected_at=datetime.now()
             )
             
@@ -106,49 +151,27 @@ class ManualModeController:
                 'created_by_controller': self.controller_id
             })
             
-            if worker_type == WorkerType.PLANNER:
-                worker = PlannerWorker(
-                    name=name,
-                    role=role,
-                    memory_system=None,  # Will be initialized by worker
-                    knowledge_validator=None,  # Will be initialized by worker
-                    browser_controller=None,  # Will be initialized by worker
-                    task_executor=None,  # Will be initialized by worker
-                    server_connection=server_connection,
-                    worker_id=worker_id,
-                    config=worker_config
-                )
-            elif worker_type == WorkerType.EXECUTOR:
-                worker = ExecutorWorker(
-                    name=name,
-                    role=role,
-                    memory_system=None,  # Will be initialized by worker
-                    knowledge_validator=None,  # Will be initialized by worker
-                    browser_controller=None,  # Will be initialized by worker
-                    task_executor=None,  # Will be initialized by worker
-                    server_connection=server_connection,
-                    worker_id=worker_id,
-                    config=worker_config
-                )
-            elif worker_type == WorkerType.VERIFIER:
-                worker = VerifierWorker(
-                    name=name,
-                    role=role,
-                    memory_system=None,  # Will be initialized by worker
-                    knowledge_validator=None,  # Will be initialized by worker
-                    browser_controller=None,  # Will be initialized by worker
-                    task_executor=None,  # Will be initialized by worker
-                    server_connection=server_connection,
-                    worker_id=worker_id,
-                    config=worker_config
-                )
-            else:
+            if worker_type not in _WORKER_CLASSES:
                 raise WorkerError(
                     f"Unsupported worker type: {worker_type}",
                     worker_id=worker_id,
                     context={'operation': 'create_worker_manually'}
                 )
             
+            module_name, class_name = _WORKER_CLASSES[worker_type]
+            worker_class = getattr(worker_modules[module_name], class_name)
+            worker = worker_class(
+                name=name,
+                role=role,
+                memory_system=None,  # Will be initialized by worker
+                knowledge_validator=None,  # Will be initialized by worker
+                browser_controller=None,  # Will be initialized by worker
+                task_executor=None,  # Will be initialized by worker
+                server_connection=server_connection,
+                worker_id=worker_id,
+                config=worker_config
+            )
+            
             # Connect worker to server
             worker.connect_to_server()
             
@@ -156,6 +179,7 @@ class ManualModeController:
             self.manual_workers[worker_id] = {
                 'worker_instance': worker,
                 'worker_type': worker_type,
+                'worker_type_str': worker_type.value,
                 'name': name,
                 'role': role,
                 'capabilities': capabilities or [],
@@ -168,7 +192,7 @@ class ManualModeController:
             self.stats['workers_created'] += 1
             self.stats['operations_performed'] += 1
             
-            self.logger.info(f"Manually created {worker_type.value} worker: {name} ({worker_id})")
+            self.logger.info("Manually created %s worker: %s (%s)", worker_type.value, name, worker_id)
             
             # Notify UI if callback is registered
             if 'worker_created' in self.ui_callbacks:
@@ -177,7 +201,7 @@ class ManualModeController:
             return worker_id
             
         except Exception as e:
-            self.logger.error(f"Manual worker creation failed: {e}")
+            self.logger.error("Manual worker creation failed: %s", e)
             raise WorkerError(
                 f"Manual worker creation failed: {e}",
                 worker_id=worker_id if 'worker_id' in locals() else None,
@@ -191,6 +215,11 @@ class ManualModeController:
         """
         Manually assign a task to a specific worker.
         
+        The task runs before this returns, unless config['async_tasks'] is
+        set: then it runs on a pool of config['task_workers'] (default 8)
+        threads and its status in get_manual_tasks() changes from
+        'assigned' once it finishes.
+        
         Args:
             worker_id: ID of the worker to assign the task to
             task_description: Description of the task
@@ -219,7 +248,7 @@ class ManualModeController:
             # Create task
             from .interfaces import Task
             
-            task_id = str(uuid.uuid4())
+            task_id = uuid.uuid4().hex
             task = Task.create_new(
                 description=task_description,
                 parameters=task_parameters or {},
@@ -234,35 +263,34 @@ class ManualModeController:
             task.id = task_id  # Override with our generated ID
             
             # Track the manual task assignment
-            self.manual_tasks[task_id] = {
+            task_info = {
                 'task': task,
                 'assigned_to': worker_id,
                 'worker_name': worker_info['name'],
-                'worker_type': worker_info['worker_type'].value,
+                'worker_type': self._worker_type_str(worker_info),
                 'assigned_at': datetime.now(),
                 'status': 'assigned',
                 'assignment_method': 'manual'
             }
-            
-            # Execute task on worker (async)
-            # Note: In a real implementation, this might be done asynchronously
-            try:
-                result = worker_instance.execute_task(task)
-                
-                # Update task status
-                self.manual_tasks[task_id]['status'] = 'completed' if result.is_successful() else 'failed'
-                self.manual_tasks[task_id]['completed_at'] = datetime.now()
-                self.manual_tasks[task_id]['result'] = result
-                
-            except Exception as task_error:
-                self.manual_tasks[task_id]['status'] = 'failed'
-                self.manual_tasks[task_id]['error'] = str(task_error)
-                self.logger.error(f"Task execution failed: {task_error}")
+            with self._tasks_lock:
+                self.manual_tasks[task_id] = task_info
+                self._tasks_by_status['assigned'].add(task_id)
+            
+            # Execute task on worker
+            if self.config.get('async_tasks', False):
+                if self._task_pool is None:
+                    self._task_pool = ThreadPoolExecutor(
+                        max_workers=self.config.get('task_workers', 8),
+                        thread_name_prefix=f"ManualTask-{self.controller_id[:8]}"
+                    )
+                self._task_pool.submit(self._execute_task, task_id, worker_instance, task)
+            else:
+                self._execute_task(task_id, worker_instance, task)
             
             self.stats['tasks_assigned'] += 1
             self.stats['operations_performed'] += 1
             
-            self.logger.info(f"Manually assigned task to {worker_info['name']}: {task_description}")
+            self.logger.info("Manually assigned task to %s: %s", worker_info['name'], task_description)
             
             # Notify UI if callback is registered
             if 'task_assigned' in self.ui_callbacks:
@@ -271,13 +299,43 @@ class ManualModeController:
             return task_id
             
         except Exception as e:
-            self.logger.error(f"Manual task assignment failed: {e}")
+            self.logger.error("Manual task assignment failed: %s", e)
             raise WorkerError(
                 f"Manual task assignment failed: {e}",
                 worker_id=worker_id,
                 context={'operation': 'assign_task_manually', 'error': str(e)}
             )
     
+    @staticmethod
+    def _worker_type_str(worker_info: Dict[str, Any]) -> str:
+        """Worker type value of a manual worker, cached at creation when possible."""
+        worker_type_str = worker_info.get('worker_type_str')
+        if worker_type_str is None:
+            worker_type_str = worker_info['worker_type'].value
+        return worker_type_str
+    
+    def _execute_task(self, task_id: str, worker_instance: Any, task: Any) -> None:
+        """Run a manual task on its worker and record the outcome."""
+        try:
+            result = worker_instance.execute_task(task)
+            
+            # Update task status
+            self._set_task_status(task_id, 'completed' if result.is_successful() else 'failed',
+                                  completed_at=datetime.now(), result=result)
+            
+        except Exception as task_error:
+            self._set_task_status(task_id, 'failed', error=str(task_error))
+            self.logger.error("Task execution failed: %s", task_error)
+    
+    def _set_task_status(self, task_id: str, status: str, **details: Any) -> None:
+        """Update a manual task's status, the status index and any other fields."""
+        with self._tasks_lock:
+            task_info = self.manual_tasks[task_id]
+            self._tasks_by_status[task_info['status']].discard(task_id)
+            self._tasks_by_status[status].add(task_id)
+            task_info['status'] = status
+            task_info.update(details)
+    
     def create_collaborative_space_manually(self, space_name: str, description: str,
                                           initial_participants: Optional[List[str]] = None,
                                           space_config: Optional[Dict[str, Any]] = None) -> str:
@@ -314,28 +372,38 @@ class ManualModeController:
                 'description': description,
                 'created_at': datetime.now(),
                 'created_by': 'manual_controller',
-                'participants': [],
+                # Insertion-ordered, so participants are listed in join order
+                'participants': {},
                 'config': space_config or {},
                 'status': 'active'
             }
             
-            # Add initial participants if specified
+            # Add initial participants if specified, joining them concurrently
             if initial_participants:
-                for worker_id in initial_participants:
-                    if worker_id in self.manual_workers:
+                known_workers = [worker_id for worker_id in dict.fromkeys(initial_participants)
+                                 if worker_id in self.manual_workers]
+                if known_workers:
+                    def join(worker_id: str) -> bool:
                         worker_instance = self.manual_workers[worker_id]['worker_instance']
-                        success = worker_instance.join_collaborative_space(space_id)
-                        
+                        return worker_instance.join_collaborative_space(space_id)
+                    
+                    with ThreadPoolExecutor(max_workers=min(16, len(known_workers))) as executor:
+                        results = list(executor.map(join, known_workers))
+                    
+                    participants = self.manual_spaces[space_id]['participants']
+                    for worker_id, success in zip(known_workers, results):
                         if success:
-                            self.manual_spaces[space_id]['participants'].append(worker_id)
-                            self.logger.info(f"Added {worker_id} to collaborative space {space_name}")
-                    else:
-                        self.logger.warning(f"Worker {worker_id} not found for space participation")
+                            participants[worker_id] = None
+                            self.logger.info("Added %s to collaborative space %s", worker_id, space_name)
+                
+                for worker_id in initial_participants:
+                    if worker_id not in self.manual_workers:
+                        self.logger.warning("Worker %s not found for space participation", worker_id)
             
             self.stats['spaces_created'] += 1
             self.stats['operations_performed'] += 1
             
-            self.logger.info(f"Manually created collaborative space: {space_name} ({space_id})")
+            self.logger.info("Manually created collaborative space: %s (%s)", space_name, space_id)
             
             # Notify UI if callback is registered
             if 'space_created' in self.ui_callbacks:
@@ -344,7 +412,7 @@ class ManualModeController:
             return space_id
             
         except Exception as e:
-            self.logger.error(f"Manual collaborative space creation failed: {e}")
+            self.logger.error("Manual collaborative space creation failed: %s", e)
             raise WorkerError(
                 f"Manual collaborative space creation failed: {e}",
                 worker_id=self.controller_id,
@@ -364,24 +432,24 @@ class ManualModeController:
         """
         try:
             if worker_id not in self.manual_workers:
-                self.logger.error(f"Worker {worker_id} not found in manual workers")
+                self.logger.error("Worker %s not found in manual workers", worker_id)
                 return False
             
             if space_id not in self.manual_spaces:
-                self.logger.error(f"Space {space_id} not found in manual spaces")
+                self.logger.error("Space %s not found in manual spaces", space_id)
                 return False
             
             worker_instance = self.manual_workers[worker_id]['worker_instance']
             success = worker_instance.join_collaborative_space(space_id)
             
             if success:
-                self.manual_spaces[space_id]['participants'].append(worker_id)
-                self.logger.info(f"Added worker {worker_id} to space {space_id}")
+                self.manual_spaces[space_id]['participants'][worker_id] = None
+                self.logger.info("Added worker %s to space %s", worker_id, space_id)
             
             return success
             
         except Exception as e:
-            self.logger.error(f"Failed to add worker to space: {e}")
+            self.logger.error("Failed to add worker to space: %s", e)
             return False
     
     def remove_worker_from_space(self, worker_id: str, space_id: str) -> bool:
@@ -397,30 +465,56 @@ class ManualModeController:
         """
         try:
             if worker_id not in self.manual_workers:
-                self.logger.error(f"Worker {worker_id} not found in manual workers")
+                self.logger.error("Worker %s not found in manual workers", worker_id)
                 return False
             
             if space_id not in self.manual_spaces:
-                self.logger.error(f"Space {space_id} not found in manual spaces")
+                self.logger.error("Space %s not found in manual spaces", space_id)
                 return False
             
             worker_instance = self.manual_workers[worker_id]['worker_instance']
             success = worker_instance.leave_collaborative_space(space_id)
             
-            if success and worker_id in self.manual_spaces[space_id]['participants']:
-                self.manual_spaces[space_id]['participants'].remove(worker_id)
-                self.logger.info(f"Removed worker {worker_id} from space {space_id}")
+            participants = self.manual_spaces[space_id]['participants']
+            if success and worker_id in participants:
+                del participants[worker_id]
+                self.logger.info("Removed worker %s from space %s", worker_id, space_id)
             
             return success
             
         except Exception as e:
-            self.logger.error(f"Failed to remove worker from space: {e}")
+            self.logger.error("Failed to remove worker from space: %s", e)
             return False
     
-    def get_manual_workers(self) -> Dict[str, Dict[str, Any]]:
+    @staticmethod
+    def _entries_since(entries: Dict[str, Dict[str, Any]], time_key: str,
+                       since: Optional[datetime]):
+        """
+        Tracked entries in insertion order, limited to those newer than ``since``.
+        
+        Entries are added in time order, so the scan walks back from the
+        newest and stops at the first one that is not newer; a UI polling
+        with its last poll time only touches entries added since then.
+        """
+        if since is None:
+            return entries.items()
+        
+        newer = []
+        for entry_id in reversed(entries):
+            info = entries[entry_id]
+            if info[time_key] <= since:
+                break
+            newer.append((entry_id, info))
+        newer.reverse()
+        return newer
+    
+    def get_manual_workers(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
         """
         Get information about all manually created workers.
         
+        Args:
+            since: Only include workers created after this time
+            
         Returns:
             Dictionary of worker information keyed by worker ID
         """
@@ -428,38 +522,45 @@ class ManualModeController:
             worker_id: {
                 'name': info['name'],
                 'role': info['role'],
-                'worker_type': info['worker_type'].value,
+                'worker_type': self._worker_type_str(info),
                 'capabilities': info['capabilities'],
                 'created_at': info['created_at'].isoformat(),
                 'status': info['status']
             }
-            for worker_id, info in self.manual_workers.items()
+            for worker_id, info in self._entries_since(self.manual_workers, 'created_at', since)
         }
     
-    def get_manual_tasks(self) -> Dict[str, Dict[str, Any]]:
+    def get_manual_tasks(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
         """
         Get information about all manually assigned tasks.
         
+        Args:
+            since: Only include tasks assigned after this time
+            
         Returns:
             Dictionary of task information keyed by task ID
         """
-        return {
-            task_id: {
-                'description': info['task'].description,
-                'assigned_to': info['assigned_to'],
-                'worker_name': info['worker_name'],
-                'worker_type': info['worker_type'],
-                'assigned_at': info['assigned_at'].isoformat(),
-                'status': info['status'],
-                'priority': info['task'].priority
+        with self._tasks_lock:
+            return {
+                task_id: {
+                    'description': info['task'].description,
+                    'assigned_to': info['assigned_to'],
+                    'worker_name': info['worker_name'],
+                    'worker_type': info['worker_type'],
+                    'assigned_at': info['assigned_at'].isoformat(),
+                    'status': info['status'],
+                    'priority': info['task'].priority
+                }
+                for task_id, info in self._entries_since(self.manual_tasks, 'assigned_at', since)
             }
-            for task_id, info in self.manual_tasks.items()
-        }
     
-    def get_manual_spaces(self) -> Dict[str, Dict[str, Any]]:
+    def get_manual_spaces(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
         """
         Get information about all manually created collaborative spaces.
         
+        Args:
+            since: Only include spaces created after this time
+            
         Returns:
             Dictionary of space information keyed by space ID
         """
@@ -468,11 +569,11 @@ class ManualModeController:
                 'name': info['name'],
                 'description': info['description'],
                 'created_at': info['created_at'].isoformat(),
-                'participants': info['participants'],
+                'participants': list(info['participants']),
                 'participant_count': len(info['participants']),
                 'status': info['status']
             }
-            for space_id, info in self.manual_spaces.items()
+            for space_id, info in self._entries_since(self.manual_spaces, 'created_at', since)
         }
     
     def register_ui_callback(self, event_type: str, callback: Callable) -> None:
@@ -484,7 +585,7 @@ class ManualModeController:
             callback: Callback function to call when event occurs
         """
         self.ui_callbacks[event_type] = callback
-        self.logger.debug(f"Registered UI callback for event: {event_type}")
+        self.logger.debug("Registered UI callback for event: %s", event_type)
     
     def get_manual_mode_status(self) -> Dict[str, Any]:
         """
@@ -493,45 +594,75 @@ class ManualModeController:
         Returns:
             Dictionary containing manual mode status and statistics
         """
+        with self._tasks_lock:
+            pending_tasks = len(self._tasks_by_status['assigned'])
+            completed_tasks = len(self._tasks_by_status['completed'])
+        
         return {
             'controller_id': self.controller_id,
             'mode': 'manual',
-            'active_workers': len([w for w in self.manual_workers.values() if w['status'] == 'active']),
-            'active_spaces': len([s for s in self.manual_spaces.values() if s['status'] == 'active']),
-            'pending_tasks': len([t for t in self.manual_tasks.values() if t['status'] == 'assigned']),
-            'completed_tasks': len([t for t in self.manual_tasks.values() if t['status'] == 'completed']),
+            'active_workers': sum(1 for w in self.manual_workers.values() if w['status'] == 'active'),
+            'active_spaces': sum(1 for s in self.manual_spaces.values() if s['status'] == 'active'),
+            'pending_tasks': pending_tasks,
+            'completed_tasks': completed_tasks,
             'statistics': self.stats,
             'ui_callbacks_registered': list(self.ui_callbacks.keys())
         }
     
+    def _run_for_each(self, entries: Dict[str, Dict[str, Any]], action: Callable[[Dict[str, Any]], Any],
+                      done_status: str, description: str) -> None:
+        """
+        Run an action on every tracked entry concurrently.
+        
+        Entries whose action succeeds get ``done_status``; failures are
+        logged and leave the entry's status unchanged.
+        """
+        if not entries:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(entries))) as executor:
+            futures = {executor.submit(action, info): entry_id for entry_id, info in entries.items()}
+            for future in as_completed(futures):
+                entry_id = futures[future]
+                try:
+                    future.result()
+                    entries[entry_id]['status'] = done_status
+                except Exception as e:
+                    self.logger.error("Error %s %s: %s", description, entry_id, e)
+    
     def shutdown(self) -> None:
         """Shutdown the manual mode controller and cleanup resources."""
         try:
+            # Let running tasks finish before their workers disconnect
+            if self._task_pool is not None:
+                self._task_pool.shutdown(wait=True)
+                self._task_pool = None
+            
             # Disconnect all manual workers
-            for worker_id, worker_info in self.manual_workers.items():
-                try:
-                    worker_instance = worker_info['worker_instance']
-                    worker_instance.disconnect_from_server()
-                    worker_info['status'] = 'disconnected'
-                except Exception as e:
-                    self.logger.error(f"Error disconnecting worker {worker_id}: {e}")
+            self._run_for_each(
+                self.manual_workers,
+                lambda worker_info: worker_info['worker_instance'].disconnect_from_server(),
+                'disconnected',
+                'disconnecting worker'
+            )
             
             # Close all manual spaces
-            for space_id, space_info in self.manual_spaces.items():
-                try:
-                    space_instance = space_info['space_instance']
-                    space_instance.close_space()
-                    space_info['status'] = 'closed'
-                except Exception as e:
-                    self.logger.error(f"Error closing space {space_id}: {e}")
+            self._run_for_each(
+                self.manual_spaces,
+                lambda space_info: space_info['space_instance'].close_space(),
+                'closed',
+                'closing space'
+            )
             
             # Clear tracking data
             self.manual_workers.clear()
             self.manual_spaces.clear()
-            self.manual_tasks.clear()
+            with self._tasks_lock:
+                self.manual_tasks.clear()
+                self._tasks_by_status.clear()
             self.ui_callbacks.clear()
             
             self.logger.info("ManualModeController shutdown complete")
             
         except Exception as e:
-            self.logger.error(f"Error during manual mode controller shutdown: {e}")
\ No newline at end of file
+            self.logger.error("Error during manual mode controller shutdown: %s", e)
\ No newline at end of file
@@ -11,13 +11,69 @@ Provides intelligent memory storage that mimics human memory:
 import sqlite3
 import json
 import os
-from typing import Dict, List, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from .interfaces import IMemorySystem, MemoryEntry, MemoryType
 from .exceptions import MemoryError
+from ..utils.helpers import fast_json_loads
 import uuid
 
 
+# Per-connection settings, applied by MemorySystem._connect(). WAL lets
+# readers run alongside a writer and, with synchronous=NORMAL, commits no
+# longer fsync the database file each time.
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA busy_timeout=5000',
+)
+
+# Trigram full-text index over content and tags. A trigram FTS5 table
+# answers LIKE '%...%' from its index, so substring searches keep their
+# exact semantics without scanning every row. It reads the text from
+# memory_entries by rowid and is kept in step by the triggers below; a
+# VACUUM can renumber those rowids, so rebuild memory_fts after one.
+_FULLTEXT_SCHEMA_SQL = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+        content, tags,
+        content='memory_entries', content_rowid='rowid',
+        tokenize='trigram'
+    );
+    
+    CREATE TRIGGER IF NOT EXISTS memory_fts_insert AFTER INSERT ON memory_entries BEGIN
+        INSERT INTO memory_fts(rowid, content, tags) VALUES (new.rowid, new.content, new.tags);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS memory_fts_delete AFTER DELETE ON memory_entries BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, content, tags)
+        VALUES ('delete', old.rowid, old.content, old.tags);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS memory_fts_update AFTER UPDATE OF content, tags ON memory_entries BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, content, tags)
+        VALUES ('delete', old.rowid, old.content, old.tags);
+        INSERT INTO memory_fts(rowid, content, tags) VALUES (new.rowid, new.content, new.tags);
+    END;
+'''
+
+# JSON escapes of the only non-ASCII characters whose lowercase contains an
+# ASCII letter (KELVIN SIGN -> "k", LATIN CAPITAL I WITH DOT -> "i");
+# tags holding them can match an ASCII keyword once decoded and lowercased
+_ASCII_LOWERING_ESCAPES = ('\\u0130', '\\u212a')
+
+
+def _json_loads(text: str) -> Any:
+    """Decode stored JSON, falling back to json for what orjson rejects (NaN, huge ints)."""
+    try:
+        return fast_json_loads(text)
+    except ValueError:
+        return json.loads(text)
+
+
 class MemorySystem(IMemorySystem):
     """
     Memory System with SQLite backend for persistent storage.
@@ -38,14 +94,42 @@ class MemorySystem(IMemorySystem):
             raise MemoryError(f"Unsupported storage backend: {storage_backend}")
         
         self.db_path = db_path
+        # One connection for the system's lifetime, shared between threads
+        # under the lock
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._fulltext = False
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the memory database with the connection pragmas applied."""
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        except sqlite3.Error as e:
+            raise MemoryError(f"Failed to open database: {str(e)}")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and yield the shared connection inside a transaction."""
+        with self._lock:
+            if self._conn is None:
+                # Reopened after close(), which used to leave the system usable
+                self._conn = self._connect()
+            with self._conn:
+                yield self._conn
+    
     def _init_database(self) -> None:
         """Initialize SQLite database schema for memory storage."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL is stored in the database file, so setting it once is enough
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # Create memory entries table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS memory_entries (
@@ -85,6 +169,53 @@ class MemorySystem(IMemorySystem):
                 
         except sqlite3.Error as e:
             raise MemoryError(f"Failed to initialize database: {str(e)}")
+        
+        self._init_fulltext_index()
+    
+    def _init_fulltext_index(self) -> None:
+        """
+        Create the trigram full-text index, if this SQLite build supports it.
+        
+        Without FTS5 or its trigram tokenizer (SQLite < 3.34), searches fall
+        back to scanning memory_entries.
+        """
+        with self._lock:
+            try:
+                exists = self._conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'memory_fts'"
+                ).fetchone()
+                self._conn.executescript(_FULLTEXT_SCHEMA_SQL)
+                if not exists:
+                    # Index the entries stored before the index existed
+                    with self._conn:
+                        self._conn.execute("INSERT INTO memory_fts(memory_fts) VALUES ('rebuild')")
+                self._fulltext = True
+            except sqlite3.OperationalError:
+                self._fulltext = False
+    
+    def _text_condition(self, terms: List[Tuple[str, str]]) -> Tuple[str, List[str]]:
+        """
+        SQL condition for rows where any column contains its search text.
+        
+        Each term is a (column, text) pair matched with LIKE '%text%'. When
+        every text has at least three characters and no wildcards, the
+        full-text index narrows the rows first; LIKE still decides the match.
+        
+        Returns:
+            Tuple of (condition, parameters)
+        """
+        condition = ' OR '.join(f"{column} LIKE ?" for column, _ in terms)
+        params = [f"%{text}%" for _, text in terms]
+        
+        if self._fulltext and all(
+            len(text) >= 3 and '%' not in text and '_' not in text for _, text in terms
+        ):
+            candidates = ' UNION '.join(
+                f"SELECT rowid FROM memory_fts WHERE {column} LIKE ?" for column, _ in terms
+            )
+            return f"rowid IN ({candidates}) AND ({condition})", params + params
+        
+        return f"({condition})", params
     
     def store_short_term(self, data: Dict[str, Any]) -> None:
         """
@@ -133,7 +264,7 @@ class MemorySystem(IMemorySystem):
             )
             
             # Store in database
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 now = datetime.now().isoformat()
                 
@@ -169,24 +300,25 @@ class MemorySystem(IMemorySystem):
             List of memory entry dictionaries matching the query
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
+                # Search in content and tags
+                text_condition, params = self._text_condition([('content', query), ('tags', query)])
+                
                 # Build query based on memory type
                 if memory_type == "both":
                     type_condition = ""
-                    params = [f"%{query}%", f"%{query}%"]
                 elif memory_type in ["short_term", "long_term"]:
                     type_condition = "AND memory_type = ?"
-                    params = [f"%{query}%", f"%{query}%", memory_type]
+                    params.append(memory_type)
                 else:
                     raise MemoryError(f"Invalid memory_type: {memory_type}")
                 
-                # Search in content and tags
                 sql_query = f'''
                     SELECT id, content, timestamp, memory_type, relevance_score, tags
                     FROM memory_entries 
-                    WHERE (content LIKE ? OR tags LIKE ?) {type_condition}
+                    WHERE {text_condition} {type_condition}
                     ORDER BY relevance_score DESC, timestamp DESC
                 '''
                 
@@ -214,7 +346,7 @@ class MemorySystem(IMemorySystem):
     def clear_short_term(self) -> None:
         """Clear all short-term memory entries."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM memory_entries WHERE memory_type = ?",
@@ -279,7 +411,7 @@ class MemorySystem(IMemorySystem):
         try:
             cutoff_date = datetime.now() - timedelta(days=days_threshold)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Count entries to be removed
@@ -310,7 +442,7 @@ class MemorySystem(IMemorySystem):
             Dictionary containing memory statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Count entries by type
@@ -358,69 +490,97 @@ class MemorySystem(IMemorySystem):
             if not context_keywords:
                 return []
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Build query based on memory type
+                conditions = []
+                params = []
                 if memory_type == "both":
-                    type_condition = ""
-                    base_params = []
+                    pass
                 elif memory_type in ["short_term", "long_term"]:
-                    type_condition = "WHERE memory_type = ?"
-                    base_params = [memory_type]
+                    conditions.append("memory_type = ?")
+                    params.append(memory_type)
                 else:
                     raise MemoryError(f"Invalid memory_type: {memory_type}")
                 
-                # Get all entries for scoring
+                # Only fetch entries containing a keyword. Scoring lowercases
+                # decoded tags, so this is exact only for keywords the stored
+                # JSON keeps verbatim; other keyword lists score every entry.
+                if all(self._is_plain_keyword(keyword) for keyword in context_keywords):
+                    terms = [(column, keyword) for keyword in context_keywords for column in ('content', 'tags')]
+                    terms.extend(('tags', escape) for escape in _ASCII_LOWERING_ESCAPES)
+                    text_condition, text_params = self._text_condition(terms)
+                    conditions.append(text_condition)
+                    params.extend(text_params)
+                
+                where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                
+                # Get candidate entries for scoring
                 sql_query = f'''
                     SELECT id, content, timestamp, memory_type, relevance_score, tags
                     FROM memory_entries 
-                    {type_condition}
+                    {where_clause}
                     ORDER BY timestamp DESC
                 '''
                 
-                cursor.execute(sql_query, base_params)
+                cursor.execute(sql_query, params)
                 rows = cursor.fetchall()
                 
-                # Score and filter entries
-                scored_entries = []
+                # Score and filter entries on the stored JSON text; only the
+                # content of the entries returned is decoded
+                scored_rows = []
                 for row in rows:
-                    entry_dict = {
-                        'id': row[0],
-                        'content': json.loads(row[1]),
-                        'timestamp': row[2],
-                        'memory_type': row[3],
-                        'relevance_score': row[4],
-                        'tags': json.loads(row[5])
-                    }
+                    tags = _json_loads(row[5])
                     
                     # Calculate context relevance score
                     context_score = self._calculate_context_relevance(
-                        entry_dict, context_keywords
+                        {'timestamp': row[2], 'tags': tags}, context_keywords,
+                        content_json=row[1]
                     )
                     
                     if context_score > 0:
-                        entry_dict['context_relevance'] = context_score
-                        entry_dict['combined_score'] = (
-                            entry_dict['relevance_score'] * 0.6 + context_score * 0.4
-                        )
-                        scored_entries.append(entry_dict)
+                        combined_score = row[4] * 0.6 + context_score * 0.4
+                        scored_rows.append((combined_score, context_score, row, tags))
                 
                 # Sort by combined score and return top results
-                scored_entries.sort(key=lambda x: x['combined_score'], reverse=True)
-                return scored_entries[:limit]
+                scored_rows.sort(key=lambda x: x[0], reverse=True)
+                return [
+                    {
+                        'id': row[0],
+                        'content': _json_loads(row[1]),
+                        'timestamp': row[2],
+                        'memory_type': row[3],
+                        'relevance_score': row[4],
+                        'tags': tags,
+                        'context_relevance': context_score,
+                        'combined_score': combined_score
+                    }
+                    for combined_score, context_score, row, tags in scored_rows[:limit]
+                ]
                 
         except (sqlite3.Error, json.JSONDecodeError) as e:
             raise MemoryError(f"Failed to retrieve by context: {str(e)}")
     
+    @staticmethod
+    def _is_plain_keyword(keyword: str) -> bool:
+        """Whether a keyword is printable ASCII that JSON stores unescaped."""
+        return (
+            keyword.isascii() and keyword.isprintable()
+            and not any(char in keyword for char in ' "\\%_')
+        )
+    
     def _calculate_context_relevance(self, entry: Dict[str, Any], 
-                                   keywords: List[str]) -> float:
+                                   keywords: List[str],
+                                   content_json: Optional[str] = None) -> float:
         """
         Calculate relevance score based on context keywords.
         
         Args:
             entry: Memory entry dictionary
             keywords: List of context keywords
+            content_json: Stored JSON of the entry's content, if at hand;
+                used instead of serializing entry['content'] again
             
         Returns:
             Relevance score between 0 and 1
@@ -429,7 +589,9 @@ class MemorySystem(IMemorySystem):
             return 0.0
         
         # Convert entry content and tags to searchable text
-        content_text = json.dumps(entry['content']).lower()
+        if content_json is None:
+            content_json = json.dumps(entry['content'])
+        content_text = content_json.lower()
         tags_text = ' '.join(entry['tags']).lower()
         combined_text = f"{content_text} {tags_text}"
         
@@ -447,8 +609,9 @@ class MemorySystem(IMemorySystem):
         
         # Boost score for exact tag matches
         tag_boost = 0
+        lowered_tags = {tag.lower() for tag in entry['tags']}
         for keyword in keywords:
-            if keyword.lower() in [tag.lower() for tag in entry['tags']]:
+            if keyword.lower() in lowered_tags:
                 tag_boost += 0.2
         
         # Time decay factor (newer memories get slight boost)
@@ -504,7 +667,7 @@ class MemorySystem(IMemorySystem):
             raise MemoryError(f"Relevance score must be between 0.0 and 1.0, got: {new_relevance}")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Update relevance score and timestamp
@@ -531,7 +694,7 @@ class MemorySystem(IMemorySystem):
             new_tags: List of tags to add
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get current tags
@@ -572,23 +735,24 @@ class MemorySystem(IMemorySystem):
             List of memory entry dictionaries with the specified tag
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
+                tag_condition, params = self._text_condition([('tags', f'"{tag}"')])
+                
                 # Build query based on memory type
                 if memory_type == "both":
                     type_condition = ""
-                    params = [f'%"{tag}"%']
                 elif memory_type in ["short_term", "long_term"]:
                     type_condition = "AND memory_type = ?"
-                    params = [f'%"{tag}"%', memory_type]
+                    params.append(memory_type)
                 else:
                     raise MemoryError(f"Invalid memory_type: {memory_type}")
                 
                 sql_query = f'''
                     SELECT id, content, timestamp, memory_type, relevance_score, tags
                     FROM memory_entries 
-                    WHERE tags LIKE ? {type_condition}
+                    WHERE {tag_condition} {type_condition}
                     ORDER BY relevance_score DESC, timestamp DESC
                 '''
                 
@@ -631,7 +795,7 @@ class MemorySystem(IMemorySystem):
             # more sophisticated similarity detection
             consolidated_count = 0
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get all memories for comparison
@@ -875,9 +1039,11 @@ class MemorySystem(IMemorySystem):
         This method ensures proper cleanup of database connections,
         particularly important on Windows systems.
         """
-        # SQLite connections are automatically closed when the connection
-        # object is garbage collected, but we can force cleanup here if needed
-        pass
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            with self._lock:
+                conn.close()
+                self._conn = None
     
     def __del__(self):
         """Destructor to ensure cleanup"""
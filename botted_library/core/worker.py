@@ -1303,6 +1303,57 @@ class Worker(IWorker):
             'uptime_seconds': (datetime.now() - self.created_at).total_seconds()
         }
     
+    def reset_state(self) -> None:
+        """
+        Reset per-task and per-role state so the worker can be reused.
+        
+        Subsystem references and lazily created AI components are kept,
+        which is what makes a reset worker cheaper than a new one. Pooled
+        workers are reset on release and must not be used by the releasing
+        caller afterwards.
+        """
+        self.state = WorkerState.IDLE
+        self.current_role = None
+        self.role_name = None
+        self.current_task = None
+        self.task_history = []
+        self.execution_metrics = {}
+        self.pending_clarifications = []
+        self.clarification_callback = None
+        if hasattr(self, '_last_response_method'):
+            del self._last_response_method
+        self.last_activity = datetime.now()
+    
+    def reassign(self, worker_id: str, role: str, config: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Rebind a reset worker to a new identity and role.
+        
+        Args:
+            worker_id: New unique identifier for the worker
+            role: Role name to initialize
+            config: Optional replacement configuration; AI components are
+                only rebuilt if it differs from the current one
+            
+        Raises:
+            WorkerError: If role initialization fails
+        """
+        self.worker_id = worker_id
+        self.logger = logging.getLogger(f"{__name__}.{self.worker_id}")
+        
+        if config is not None:
+            previous_config = self.config
+            self.config = config
+            self._setup_default_config()
+            if self.config != previous_config:
+                # AI components are built from config, so rebuild them lazily
+                self._llm = None
+                self._reasoning_engine = None
+                self._code_executor = None
+        
+        self.created_at = datetime.now()
+        self.last_activity = datetime.now()
+        self.initialize_role(role)
+    
     def set_clarification_callback(self, callback: callable) -> None:
         """Set callback function for handling clarification requests"""
         self.clarification_callback = callback
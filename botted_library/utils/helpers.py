@@ -15,6 +15,12 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List, Union
 from urllib.parse import urlparse, urljoin
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
 
 def validate_url(url: str) -> bool:
     """
@@ -211,6 +217,44 @@ def safe_json_dumps(obj: Any, default: Any = None, **kwargs) -> str:
         return "{}"
 
 
+def fast_json_dumps(obj: Any) -> str:
+    """
+    Serialize object to a compact JSON string, using orjson when available
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string without insignificant whitespace, with non-ASCII
+        characters left unescaped as orjson writes them
+        
+    Raises:
+        TypeError: If the object is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def fast_json_loads(json_str: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON string, using orjson when available
+    
+    Args:
+        json_str: JSON string or bytes to parse
+        
+    Returns:
+        Parsed JSON object
+        
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
 def ensure_directory(path: Union[str, Path]) -> Path:
     """
     Ensure directory exists, create if necessary
@@ -46,6 +46,7 @@ setup(
     extras_require={
         "openai": ["openai>=1.3.0"],
         "anthropic": ["anthropic>=0.7.0"],
+        "speedups": ["orjson>=3.6.0"],
         "dev": [
             "pytest>=7.4.0",
             "pytest-mock>=3.12.0",
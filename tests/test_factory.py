@@ -0,0 +1,132 @@
+"""
+Unit tests for ComponentFactory worker pooling
+
+Tests acquire_worker/release_worker reuse, the pool size bound, state reset
+on release, and configuration isolation between successive users.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from botted_library.core.factory import ComponentFactory
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for ComponentFactory.acquire_worker/release_worker"""
+    
+    def setUp(self):
+        """Set up a factory whose subsystems are already cached"""
+        self.factory = ComponentFactory({
+            'worker_pool_size': 1,
+            'worker': {'shared_setting': 'factory'}
+        })
+        self.factory._memory_system = Mock()
+        self.factory._knowledge_validator = Mock()
+        self.factory._browser_controller = Mock()
+        self.factory._task_executor = Mock()
+    
+    def test_acquire_creates_worker_when_pool_empty(self):
+        """Test acquiring from an empty pool creates a new worker"""
+        worker = self.factory.acquire_worker("worker_1", "editor")
+        
+        self.assertEqual(worker.worker_id, "worker_1")
+        self.assertEqual(worker.role_name, "editor")
+        self.assertEqual(worker.config['shared_setting'], 'factory')
+    
+    def test_release_and_reacquire_reuses_worker(self):
+        """Test a released worker is handed out again under a new identity"""
+        worker = self.factory.acquire_worker("worker_1", "editor")
+        self.assertTrue(self.factory.release_worker(worker))
+        
+        reused = self.factory.acquire_worker("worker_2", "researcher")
+        
+        self.assertIs(reused, worker)
+        self.assertEqual(reused.worker_id, "worker_2")
+        self.assertEqual(reused.role_name, "researcher")
+    
+    def test_pool_size_bound(self):
+        """Test release stops pooling once the pool is full"""
+        first = self.factory.acquire_worker("worker_1", "editor")
+        second = self.factory.acquire_worker("worker_2", "editor")
+        
+        self.assertTrue(self.factory.release_worker(first))
+        self.assertFalse(self.factory.release_worker(second))
+        self.assertEqual(len(self.factory._worker_pool), 1)
+    
+    def test_pooling_disabled_by_default(self):
+        """Test workers are not pooled without worker_pool_size"""
+        factory = ComponentFactory()
+        factory._memory_system = Mock()
+        factory._knowledge_validator = Mock()
+        factory._browser_controller = Mock()
+        factory._task_executor = Mock()
+        
+        worker = factory.acquire_worker("worker_1", "editor")
+        
+        self.assertFalse(factory.release_worker(worker))
+        self.assertEqual(len(factory._worker_pool), 0)
+    
+    def test_release_resets_state(self):
+        """Test release clears per-task and per-role state"""
+        worker = self.factory.acquire_worker("worker_1", "editor")
+        worker.task_history.append({'task_id': 'task_1'})
+        worker.pending_clarifications.append({'id': 'clarification_1'})
+        worker.clarification_callback = Mock()
+        worker._last_response_method = 'callback'
+        
+        self.factory.release_worker(worker)
+        
+        self.assertIsNone(worker.current_role)
+        self.assertIsNone(worker.role_name)
+        self.assertIsNone(worker.current_task)
+        self.assertEqual(worker.task_history, [])
+        self.assertEqual(worker.pending_clarifications, [])
+        self.assertIsNone(worker.clarification_callback)
+        self.assertFalse(hasattr(worker, '_last_response_method'))
+    
+    def test_config_isolation_between_users(self):
+        """Test a reused worker does not keep the previous user's config"""
+        worker = self.factory.acquire_worker("worker_1", "editor", {'user_setting': 'first'})
+        self.assertEqual(worker.config['user_setting'], 'first')
+        self.factory.release_worker(worker)
+        
+        reused = self.factory.acquire_worker("worker_2", "editor")
+        
+        self.assertIs(reused, worker)
+        self.assertNotIn('user_setting', reused.config)
+        self.assertEqual(reused.config['shared_setting'], 'factory')
+    
+    def test_reacquire_with_same_config_keeps_ai_components(self):
+        """Test a reused worker keeps its AI components when the config is unchanged"""
+        worker = self.factory.acquire_worker("worker_1", "editor", {'user_setting': 'x'})
+        llm = worker._llm = Mock()
+        self.factory.release_worker(worker)
+        
+        reused = self.factory.acquire_worker("worker_2", "researcher", {'user_setting': 'x'})
+        
+        self.assertIs(reused, worker)
+        self.assertIs(reused._llm, llm)
+    
+    def test_reacquire_with_new_config_rebuilds_ai_components(self):
+        """Test a reused worker drops its AI components when the config changes"""
+        worker = self.factory.acquire_worker("worker_1", "editor", {'user_setting': 'x'})
+        worker._llm = Mock()
+        self.factory.release_worker(worker)
+        
+        reused = self.factory.acquire_worker("worker_2", "editor", {'user_setting': 'y'})
+        
+        self.assertIs(reused, worker)
+        self.assertIsNone(reused._llm)
+    
+    def test_acquired_config_matches_create_worker(self):
+        """Test a pooled worker gets the same config as a freshly created one"""
+        fresh = self.factory.create_worker("worker_1", "editor", {'user_setting': 'x'})
+        pooled = self.factory.acquire_worker("worker_2", "editor")
+        self.factory.release_worker(pooled)
+        pooled = self.factory.acquire_worker("worker_3", "editor", {'user_setting': 'x'})
+        
+        self.assertEqual(pooled.config, fresh.config)
+
+
+if __name__ == '__main__':
+    unittest.main()
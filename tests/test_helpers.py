@@ -0,0 +1,39 @@
+"""
+Unit tests for the JSON helpers
+
+Tests that fast_json_dumps gives the same output with and without orjson.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from botted_library.utils import helpers
+from botted_library.utils.helpers import fast_json_dumps, fast_json_loads
+
+
+class TestFastJson(unittest.TestCase):
+    """Test cases for fast_json_dumps and fast_json_loads"""
+    
+    def test_fallback_keeps_non_ascii(self):
+        """Test the standard library fallback writes non-ASCII text unescaped"""
+        data = {'name': 'Zoë', 'city': 'Zürich', 'greeting': 'こんにちは'}
+        
+        with patch.object(helpers, 'orjson', None):
+            encoded = fast_json_dumps(data)
+        
+        self.assertEqual(encoded, '{"name":"Zoë","city":"Zürich","greeting":"こんにちは"}')
+        self.assertEqual(fast_json_loads(encoded), data)
+    
+    @unittest.skipIf(helpers.orjson is None, "orjson is not installed")
+    def test_fallback_matches_orjson(self):
+        """Test the fallback and orjson produce identical strings"""
+        data = {'text': 'naïve café', 'items': [1, 2.5, None, True], 'nested': {'emoji': '🙂'}}
+        
+        with patch.object(helpers, 'orjson', None):
+            fallback = fast_json_dumps(data)
+        
+        self.assertEqual(fallback, fast_json_dumps(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the core data models
+
+Tests the BrowserAction factory cache and serialization round trips.
+"""
+
+import copy
+import dataclasses
+import json
+import pickle
+import unittest
+
+from botted_library.core.exceptions import DataValidationError, SerializationError
+from botted_library.core.interfaces import (
+    ActionType, BrowserAction, MemoryEntry, MemoryType, Task, TaskResult, TaskStatus
+)
+
+
+class TestBrowserActionFactories(unittest.TestCase):
+    """Test cases for the cached BrowserAction.create_* helpers"""
+    
+    def test_repeated_arguments_share_instance(self):
+        """Test repeated arguments return the cached action"""
+        first = BrowserAction.create_click('btn', selector='#x')
+        second = BrowserAction.create_click('btn', selector='#x')
+        
+        self.assertIs(first, second)
+    
+    def test_cached_parameters_are_read_only(self):
+        """Test a cached action's parameters cannot be changed for later callers"""
+        action = BrowserAction.create_click('btn', selector='#x')
+        
+        with self.assertRaises(TypeError):
+            action.parameters['selector'] = '#evil'
+        
+        self.assertEqual(BrowserAction.create_click('btn', selector='#x').parameters,
+                         {'selector': '#x'})
+    
+    def test_cached_action_copies_and_pickles(self):
+        """Test cached actions still deepcopy, pickle and convert with asdict"""
+        action = BrowserAction.create_click('btn', coordinates=(1, 2))
+        
+        self.assertEqual(copy.deepcopy(action), action)
+        self.assertEqual(copy.copy(action), action)
+        unpickled = pickle.loads(pickle.dumps(action))
+        self.assertEqual(unpickled, action)
+        with self.assertRaises(TypeError):
+            unpickled.parameters['coordinates'] = (0, 0)
+        self.assertEqual(dataclasses.asdict(action), {
+            'action_type': ActionType.CLICK,
+            'target': 'btn',
+            'parameters': {'coordinates': (1, 2)},
+            'expected_outcome': 'Element clicked'
+        })
+    
+    def test_all_factories_return_read_only_parameters(self):
+        """Test every create_* helper freezes its parameters"""
+        actions = [
+            BrowserAction.create_type('input', 'hello'),
+            BrowserAction.create_scroll('page', 'down', 3),
+            BrowserAction.create_wait('body', timeout=5),
+        ]
+        for action in actions:
+            with self.assertRaises(TypeError):
+                action.parameters['extra'] = True
+    
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test list coordinates still build a fresh action each call"""
+        first = BrowserAction.create_click('btn', coordinates=[1, 2])
+        second = BrowserAction.create_click('btn', coordinates=[1, 2])
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+    
+    def test_factory_action_validates(self):
+        """Test validate() accepts the read-only parameters"""
+        BrowserAction.create_scroll('page', 'down').validate()
+    
+    def test_factory_action_serializes(self):
+        """Test a factory action round-trips through JSON and to_dict(copy=True)"""
+        action = BrowserAction.create_click('btn', selector='#x')
+        
+        self.assertEqual(BrowserAction.from_json(action.to_json()), action)
+        self.assertEqual(action.to_dict(copy=True)['parameters'], {'selector': '#x'})
+        self.assertEqual(action.to_mapping()['action_type'], ActionType.CLICK)
+
+
+class TestFromJsonErrors(unittest.TestCase):
+    """Test cases for the errors raised by from_json and from_json_array"""
+    
+    def test_unknown_enum_value_raises_serialization_error(self):
+        """Test an unknown enum value is reported as a deserialization failure"""
+        result = TaskResult('task_1', TaskStatus.COMPLETED, {}, 1.0, 0.5, [])
+        entry = MemoryEntry.create_new({'a': 1}, MemoryType.SHORT_TERM)
+        action = BrowserAction.create_wait('body')
+        cases = [
+            (TaskResult, result.to_dict(), 'status'),
+            (MemoryEntry, entry.to_dict(), 'memory_type'),
+            (BrowserAction, action.to_dict(), 'action_type'),
+        ]
+        for model, data, enum_field in cases:
+            data[enum_field] = 'bogus'
+            with self.assertRaises(SerializationError) as context:
+                model.from_json(json.dumps(data))
+            self.assertIsInstance(context.exception.original_exception, DataValidationError)
+    
+    def test_invalid_field_raises_serialization_error(self):
+        """Test a field that fails validation is reported as a deserialization failure"""
+        data = Task.create_new("Test task", {}).to_dict()
+        data['priority'] = -1
+        
+        with self.assertRaises(SerializationError):
+            Task.from_json(json.dumps(data))
+    
+    def test_invalid_array_item_raises_serialization_error(self):
+        """Test one invalid item fails the whole array with SerializationError"""
+        items = [BrowserAction.create_wait('body').to_dict(), {'action_type': 'bogus'}]
+        
+        with self.assertRaises(SerializationError):
+            BrowserAction.from_json_array(json.dumps(items))
+        with self.assertRaises(SerializationError):
+            Task.from_json_array(json.dumps([dict(Task.create_new("Test task", {}).to_dict(), id='')]))
+
+
+if __name__ == '__main__':
+    unittest.main()
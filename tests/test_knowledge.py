@@ -0,0 +1,120 @@
+"""
+Unit tests for KnowledgeValidator persistence
+
+Tests that buffered validation results survive a failed flush, that
+learning feedback is written together with its source update, and that
+fast_status agrees with the stored source reputation.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from botted_library.core.knowledge import KnowledgeValidator
+
+
+class TestValidationPersistence(unittest.TestCase):
+    """Test cases for flush() and feedback persistence"""
+    
+    def setUp(self):
+        """Set up a validator on a temporary database file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'knowledge.db')
+        self.validator = KnowledgeValidator(self.db_path)
+    
+    def tearDown(self):
+        """Close the validator and remove the database"""
+        self.validator.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _count(self, sql):
+        """Run a single-value query on a separate connection"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(sql).fetchone()[0]
+        finally:
+            conn.close()
+    
+    def test_failed_flush_keeps_rows(self):
+        """Test buffered rows are kept for the next flush when a write fails"""
+        self.validator.check_accuracy("The sky is blue", "weather")
+        pending = list(self.validator._pending_validations)
+        self.assertEqual(len(pending), 1)
+        
+        with patch.object(self.validator, '_write_validation_rows',
+                          side_effect=sqlite3.OperationalError("disk I/O error")):
+            self.validator.flush()
+        
+        self.assertEqual(self.validator._pending_validations, pending)
+        self.assertEqual(self._count("SELECT COUNT(*) FROM validation_history"), 0)
+        
+        self.validator.flush()
+        
+        self.assertEqual(self.validator._pending_validations, [])
+        self.assertEqual(self._count("SELECT COUNT(*) FROM validation_history"), 1)
+    
+    def test_feedback_written_with_source_update(self):
+        """Test feedback history is committed with the source update, without a flush"""
+        self.validator.learn_from_validation_feedback('example.org', 'Some claim', 'correct', 0.8)
+        
+        self.assertEqual(self.validator._pending_validations, [])
+        self.assertEqual(self._count(
+            "SELECT COUNT(*) FROM validation_history WHERE validation_method = 'user_feedback'"), 1)
+        self.assertEqual(self._count(
+            "SELECT feedback_count FROM source_reliability WHERE source = 'example.org'"), 1)
+    
+    def test_failed_feedback_writes_nothing(self):
+        """Test a failed history write also rolls back the source update"""
+        with patch.object(self.validator, '_write_validation_rows',
+                          side_effect=sqlite3.OperationalError("disk I/O error")):
+            self.validator.learn_from_validation_feedback('example.org', 'Some claim', 'correct')
+        
+        self.assertEqual(self._count(
+            "SELECT COUNT(*) FROM source_reliability WHERE source = 'example.org'"), 0)
+        self.assertEqual(self._count("SELECT COUNT(*) FROM validation_history"), 0)
+
+
+
+class TestSourceStatus(unittest.TestCase):
+    """Test cases for fast_status and get_source_reputation"""
+    
+    def setUp(self):
+        """Set up a validator on a temporary database file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.validator = KnowledgeValidator(os.path.join(self.temp_dir, 'knowledge.db'))
+    
+    def tearDown(self):
+        """Close the validator and remove the database"""
+        self.validator.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_fast_status_matches_reputation(self):
+        """Test fast_status agrees with the status in the full reputation"""
+        self.validator.add_trusted_source('https://docs.example.org/guide')
+        self.validator.blacklist_source('spam.example.com', 'spam')
+        self.validator.validate_source('blog.example.net')
+        
+        for source, status in (('docs.example.org', 'trusted'),
+                               ('spam.example.com', 'blacklisted'),
+                               ('blog.example.net', None)):
+            self.assertEqual(self.validator.fast_status(source), status)
+            reputation = self.validator.get_source_reputation(source)
+            if status is not None:
+                self.assertEqual(reputation['status'], status)
+            self.assertIsNotNone(reputation['reliability_score'])
+            self.assertIn('validation_history', reputation)
+    
+    def test_removed_trusted_source_has_no_fast_status(self):
+        """Test removing a trusted source clears its fast_status"""
+        self.validator.add_trusted_source('docs.example.org')
+        self.validator.remove_trusted_source('docs.example.org')
+        
+        self.assertIsNone(self.validator.fast_status('docs.example.org'))
+        self.assertNotEqual(self.validator.get_source_reputation('docs.example.org')['status'], 'trusted')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,342 @@
+"""
+Unit tests for LLMInterface
+
+Tests the think() response cache, both exact and semantic, and concurrent
+generation with abatch_think().
+Also checks that instance attributes can still be patched in tests.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from botted_library.core.llm_interface import LLMError, LLMInterface, LLMProvider, MockLLMProvider
+
+
+# Cache enabled and no conversation history, so repeated prompts can hit
+STATELESS_CACHED = {'response_cache_size': 16, 'max_conversation_history': 0}
+
+
+class CountingProvider(LLMProvider):
+    """Provider that numbers its responses and records every call"""
+    
+    __slots__ = ('calls',)
+    
+    def __init__(self):
+        self.calls = []
+    
+    def generate_response(self, prompt, context=None):
+        self.calls.append((prompt, context))
+        return f"response {len(self.calls)} to {prompt}"
+    
+    def generate_structured_response(self, prompt, schema, context=None):
+        return {}
+
+
+class AsyncProvider(LLMProvider):
+    """Async provider with per-prompt delays and failures"""
+    
+    __slots__ = ('delays', 'failures', 'contexts', 'in_flight', 'max_in_flight')
+    
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        self.failures = failures or {}
+        self.contexts = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def generate_response(self, prompt, context=None):
+        raise AssertionError("abatch_think must use agenerate_response")
+    
+    def generate_structured_response(self, prompt, schema, context=None):
+        return {}
+    
+    async def agenerate_response(self, prompt, context=None):
+        self.contexts[prompt] = context
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(prompt, 0.01))
+            if prompt in self.failures:
+                raise self.failures[prompt]
+            return f"answer to {prompt}"
+        finally:
+            self.in_flight -= 1
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the think() response cache"""
+    
+    def setUp(self):
+        """Set up a cached interface without history over a counting provider"""
+        self.provider = CountingProvider()
+        self.llm = LLMInterface(self.provider, STATELESS_CACHED)
+    
+    def test_cache_disabled_by_default(self):
+        """Test the response cache is opt-in"""
+        llm = LLMInterface(self.provider, {'max_conversation_history': 0})
+        llm.think("hello")
+        llm.think("hello")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(len(llm._response_cache), 0)
+    
+    def test_repeated_prompt_hits_cache(self):
+        """Test a repeated prompt and context is answered from the cache"""
+        first = self.llm.think("hello", {'role': 'editor'})
+        second = self.llm.think("hello", {'role': 'editor'})
+        
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.provider.calls), 1)
+    
+    def test_different_history_misses_cache(self):
+        """Test a repeated prompt gets a fresh response once the history has changed"""
+        llm = LLMInterface(self.provider, {'response_cache_size': 16})
+        first = llm.think("hello")
+        second = llm.think("hello")
+        
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(len(llm.conversation_history), 2)
+        
+        # Same (empty) history as the first call, so it hits again
+        llm.clear_history()
+        self.assertEqual(llm.think("hello"), first)
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_different_context_misses_cache(self):
+        """Test the context is part of the cache key"""
+        self.llm.think("hello", {'role': 'editor'})
+        self.llm.think("hello", {'role': 'researcher'})
+        
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used response is evicted first"""
+        llm = LLMInterface(self.provider, dict(STATELESS_CACHED, response_cache_size=2))
+        llm.think("a")
+        llm.think("b")
+        llm.think("a")  # hit, so "b" is now least recently used
+        llm.think("c")  # evicts "b"
+        
+        llm.think("a")
+        self.assertEqual(len(self.provider.calls), 3)
+        llm.think("b")
+        self.assertEqual(len(self.provider.calls), 4)
+        self.assertEqual(len(llm._response_cache), 2)
+    
+    def test_cache_disabled_with_size_zero(self):
+        """Test response_cache_size=0 disables the cache"""
+        llm = LLMInterface(self.provider, dict(STATELESS_CACHED, response_cache_size=0))
+        llm.think("hello")
+        llm.think("hello")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(len(llm._response_cache), 0)
+    
+    def test_clear_response_cache(self):
+        """Test clear_response_cache() forces a fresh response"""
+        self.llm.think("hello")
+        self.llm.clear_response_cache()
+        response = self.llm.think("hello")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(response, "response 2 to hello")
+    
+    def test_unserializable_context_not_cached(self):
+        """Test a context that is not plain JSON bypasses the cache"""
+        context = {'handle': object()}
+        self.llm.think("hello", context)
+        self.llm.think("hello", context)
+        
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(len(self.llm._response_cache), 0)
+    
+    def test_distinct_objects_with_same_repr_not_shared(self):
+        """Test objects that only agree on repr() do not share a response"""
+        class Handle:
+            def __repr__(self):
+                return "Handle()"
+        
+        self.llm.think("hello", {'handle': Handle()})
+        self.llm.think("hello", {'handle': Handle()})
+        
+        self.assertEqual(len(self.provider.calls), 2)
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test cases for the embedding-based semantic cache"""
+    
+    def setUp(self):
+        """Set up an interface whose embeddings come from a lookup table"""
+        self.embeddings = {
+            "what is the capital of france": (1.0, 0.0),
+            "capital of france?": (0.99, 0.05),
+            "how tall is everest": (0.0, 1.0),
+            "silence": (0.0, 0.0),
+        }
+        self.provider = CountingProvider()
+        self.llm = LLMInterface(self.provider, STATELESS_CACHED, embed_fn=self.embeddings.__getitem__)
+    
+    def test_similar_prompt_hits_cache(self):
+        """Test a prompt above the similarity threshold reuses the response"""
+        first = self.llm.think("what is the capital of france")
+        second = self.llm.think("capital of france?")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.provider.calls), 1)
+    
+    def test_dissimilar_prompt_misses_cache(self):
+        """Test a prompt below the similarity threshold is sent to the provider"""
+        self.llm.think("what is the capital of france")
+        self.llm.think("how tall is everest")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_threshold_is_configurable(self):
+        """Test semantic_cache_threshold controls what counts as similar"""
+        llm = LLMInterface(self.provider, dict(STATELESS_CACHED, semantic_cache_threshold=0.9999),
+                           embed_fn=self.embeddings.__getitem__)
+        llm.think("what is the capital of france")
+        llm.think("capital of france?")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_context_must_match(self):
+        """Test semantic hits require the same context"""
+        self.llm.think("what is the capital of france", {'role': 'editor'})
+        self.llm.think("capital of france?", {'role': 'researcher'})
+        
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_history_must_match(self):
+        """Test semantic hits require the same conversation history"""
+        llm = LLMInterface(self.provider, embed_fn=self.embeddings.__getitem__)
+        llm.think("what is the capital of france")
+        llm.think("capital of france?")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+    
+    def test_zero_embedding_not_cached(self):
+        """Test a zero embedding never matches"""
+        self.llm.think("silence")
+        self.llm.clear_response_cache()
+        self.llm.think("silence")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+        self.assertEqual(len(self.llm._semantic_cache), 0)
+    
+    def test_clear_response_cache_clears_semantic_cache(self):
+        """Test clear_response_cache() also empties the semantic cache"""
+        self.llm.think("what is the capital of france")
+        self.llm.clear_response_cache()
+        self.llm.think("capital of france?")
+        
+        self.assertEqual(len(self.provider.calls), 2)
+
+
+class TestBatchThink(unittest.TestCase):
+    """Test cases for LLMInterface.abatch_think"""
+    
+    def test_results_in_prompt_order(self):
+        """Test responses come back in prompt order, not completion order"""
+        provider = AsyncProvider(delays={'slow': 0.05, 'fast': 0.0})
+        llm = LLMInterface(provider)
+        
+        responses = asyncio.run(llm.abatch_think(['slow', 'fast']))
+        
+        self.assertEqual(responses, ['answer to slow', 'answer to fast'])
+    
+    def test_failure_in_its_own_slot(self):
+        """Test a failed prompt yields an LLMError without failing the batch"""
+        provider = AsyncProvider(failures={'bad': ValueError("boom")})
+        llm = LLMInterface(provider)
+        
+        responses = asyncio.run(llm.abatch_think(['good', 'bad', 'other']))
+        
+        self.assertEqual(responses[0], 'answer to good')
+        self.assertIsInstance(responses[1], LLMError)
+        self.assertIsInstance(responses[1].original_exception, ValueError)
+        self.assertEqual(responses[2], 'answer to other')
+    
+    def test_concurrency_bound(self):
+        """Test no more than max_concurrency requests are in flight"""
+        provider = AsyncProvider()
+        llm = LLMInterface(provider, {'max_concurrency': 3})
+        
+        asyncio.run(llm.abatch_think([f"prompt {i}" for i in range(10)]))
+        
+        self.assertEqual(provider.max_in_flight, 3)
+    
+    def test_history_updated_in_prompt_order(self):
+        """Test successful exchanges are added to the history in prompt order"""
+        provider = AsyncProvider(delays={'first': 0.05}, failures={'second': ValueError("boom")})
+        llm = LLMInterface(provider)
+        
+        asyncio.run(llm.abatch_think(['first', 'second', 'third']))
+        
+        self.assertEqual(
+            [entry['prompt'] for entry in llm.conversation_history],
+            ['first', 'third']
+        )
+        self.assertEqual(
+            [message['content'] for message in llm.history_messages],
+            ['first', 'answer to first', 'third', 'answer to third']
+        )
+    
+    def test_prompts_see_history_from_batch_start(self):
+        """Test every prompt is sent the history as it was before the batch"""
+        provider = AsyncProvider()
+        llm = LLMInterface(provider)
+        asyncio.run(llm.abatch_think(['earlier']))
+        
+        asyncio.run(llm.abatch_think(['a', 'b']))
+        
+        for prompt in ('a', 'b'):
+            history = provider.contexts[prompt]['conversation_history']
+            self.assertEqual([entry['prompt'] for entry in history], ['earlier'])
+    
+    def test_cancellation_propagates(self):
+        """Test a cancelled request raises instead of becoming a response"""
+        provider = AsyncProvider(failures={'cancelled': asyncio.CancelledError()})
+        llm = LLMInterface(provider)
+        
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(llm.abatch_think(['good', 'cancelled']))
+        
+        self.assertEqual(len(llm.conversation_history), 0)
+    
+    def test_context_count_mismatch(self):
+        """Test abatch_think rejects a contexts list of the wrong length"""
+        llm = LLMInterface(AsyncProvider())
+        
+        with self.assertRaises(LLMError):
+            asyncio.run(llm.abatch_think(['a', 'b'], [{}]))
+
+
+class TestInstancePatching(unittest.TestCase):
+    """Test cases for patch.object() on LLM instances"""
+    
+    def test_patch_provider_method(self):
+        """Test a provider instance's generate_response can be patched"""
+        provider = MockLLMProvider()
+        llm = LLMInterface(provider)
+        
+        with patch.object(provider, 'generate_response', return_value="patched") as mock_generate:
+            self.assertEqual(llm.think("hello"), "patched")
+        
+        mock_generate.assert_called_once()
+        self.assertNotEqual(provider.generate_response("hello"), "patched")
+    
+    def test_patch_interface_method(self):
+        """Test an LLMInterface instance's methods can be patched"""
+        llm = LLMInterface(MockLLMProvider())
+        
+        with patch.object(llm, 'think', return_value="patched"):
+            self.assertEqual(llm.think("hello"), "patched")
+        
+        self.assertNotEqual(llm.think("hello"), "patched")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the MemorySystem full-text index
+
+Tests that the trigram index stays in step with memory_entries, is built
+for databases created before it existed, and is skipped for searches it
+cannot answer.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from botted_library.core.memory import MemorySystem
+
+
+class TestFullTextIndex(unittest.TestCase):
+    """Test cases for the memory_fts index and its triggers"""
+    
+    def setUp(self):
+        """Set up a memory system on a temporary database file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'memory.db')
+        self.memory = MemorySystem(db_path=self.db_path)
+        if not self.memory._fulltext:
+            self.memory.close()
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.skipTest("SQLite build lacks FTS5 trigram support")
+    
+    def tearDown(self):
+        """Close the memory system and remove the database"""
+        self.memory.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _indexed_ids(self, text):
+        """IDs of entries the index returns for a substring of content or tags"""
+        with self.memory._connection() as conn:
+            return {row[0] for row in conn.execute('''
+                SELECT memory_entries.id FROM memory_fts
+                JOIN memory_entries ON memory_entries.rowid = memory_fts.rowid
+                WHERE memory_fts MATCH ?
+            ''', (f'"{text}"',))}
+    
+    def _indexed_row_count(self):
+        """Number of rows in the index itself, whether or not they are stale"""
+        with self.memory._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM memory_fts_docsize").fetchone()[0]
+    
+    def _assert_index_consistent(self):
+        """Fail unless the index matches memory_entries exactly"""
+        with self.memory._connection() as conn:
+            conn.execute("INSERT INTO memory_fts(memory_fts, rank) VALUES ('integrity-check', 1)")
+    
+    def test_insert_is_indexed(self):
+        """Test stored entries are added to the index"""
+        self.memory.store_short_term({'content': {'text': 'zebra crossing'}, 'tags': ['road']})
+        entry_id = self.memory.retrieve_by_query('zebra')[0]['id']
+        
+        self.assertEqual(self._indexed_ids('zebra'), {entry_id})
+        self.assertEqual(self._indexed_ids('road'), {entry_id})
+        self._assert_index_consistent()
+    
+    def test_tag_update_is_indexed(self):
+        """Test add_memory_tags updates the indexed tags"""
+        self.memory.store_long_term({'content': {'text': 'wading birds'}, 'tags': ['heron']})
+        entry_id = self.memory.retrieve_by_query('wading')[0]['id']
+        
+        self.memory.add_memory_tags(entry_id, ['flamingo'])
+        
+        self.assertEqual(self._indexed_ids('flamingo'), {entry_id})
+        self.assertEqual(self._indexed_ids('heron'), {entry_id})
+        self.assertEqual([entry['id'] for entry in self.memory.retrieve_by_query('flamingo')],
+                         [entry_id])
+        self._assert_index_consistent()
+    
+    def test_delete_is_unindexed(self):
+        """Test clear_short_term removes the deleted entries from the index"""
+        self.memory.store_short_term({'content': {'text': 'temporary note'}})
+        self.memory.store_long_term({'content': {'text': 'permanent note'}})
+        
+        self.memory.clear_short_term()
+        
+        self.assertEqual(self._indexed_row_count(), 1)
+        self.assertEqual(self._indexed_ids('temporary'), set())
+        self.assertEqual(len(self._indexed_ids('permanent')), 1)
+        self.assertEqual(self.memory.retrieve_by_query('temporary'), [])
+        self._assert_index_consistent()
+    
+    def test_existing_database_is_indexed_on_open(self):
+        """Test opening a database created without the index builds it from the entries"""
+        self.memory.store_long_term({'content': {'text': 'legacy record'}})
+        self.memory.close()
+        
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.executescript('''
+                DROP TRIGGER memory_fts_insert;
+                DROP TRIGGER memory_fts_delete;
+                DROP TRIGGER memory_fts_update;
+                DROP TABLE memory_fts;
+            ''')
+        conn.close()
+        
+        self.memory = MemorySystem(db_path=self.db_path)
+        
+        self.assertTrue(self.memory._fulltext)
+        self.assertEqual(len(self._indexed_ids('legacy')), 1)
+        self._assert_index_consistent()
+    
+    def test_short_and_wildcard_queries_skip_index(self):
+        """Test searches the trigram index cannot answer fall back to LIKE"""
+        for text in ('ab', 'a%c', 'snake_case'):
+            condition, params = self.memory._text_condition([('content', text)])
+            self.assertNotIn('memory_fts', condition)
+            self.assertEqual(params, [f'%{text}%'])
+        
+        condition, params = self.memory._text_condition([('content', 'abc')])
+        self.assertIn('memory_fts', condition)
+        self.assertEqual(params, ['%abc%', '%abc%'])
+    
+    def test_fallback_queries_still_match(self):
+        """Test short and wildcard searches return the same entries as before"""
+        self.memory.store_short_term({'content': {'text': 'ab test'}})
+        self.memory.store_short_term({'content': {'text': 'snake_case name'}})
+        self.memory.store_short_term({'content': {'text': 'snakeXcase name'}})
+        
+        self.assertEqual(len(self.memory.retrieve_by_query('ab')), 1)
+        # LIKE treats "_" as a single-character wildcard
+        self.assertEqual(len(self.memory.retrieve_by_query('snake_case')), 2)
+        self.assertEqual(len(self.memory.retrieve_by_query('snakeXcase')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -151,6 +151,86 @@ class TestManualModeController(unittest.TestCase):
         # Verify task execution
         mock_worker.execute_task.assert_called_once()
     
+    @patch('botted_library.core.interfaces.Task')
+    def test_assign_task_manually_async(self, mock_task_class):
+        """Test background task execution when async_tasks is enabled"""
+        controller = ManualModeController(
+            server_instance=self.mock_server,
+            config={'async_tasks': True}
+        )
+        
+        mock_worker = Mock()
+        mock_result = Mock()
+        mock_result.is_successful.return_value = True
+        mock_worker.execute_task.return_value = mock_result
+        
+        worker_id = "test_worker_id"
+        controller.manual_workers[worker_id] = {
+            'worker_instance': mock_worker,
+            'name': 'Test Worker',
+            'worker_type': WorkerType.EXECUTOR,
+            'status': 'active'
+        }
+        mock_task_class.create_new.return_value = Mock()
+        
+        task_id = controller.assign_task_manually(
+            worker_id=worker_id,
+            task_description="Test task"
+        )
+        
+        # Wait for the background task to finish
+        controller._task_pool.shutdown(wait=True)
+        
+        self.assertEqual(controller.manual_tasks[task_id]['status'], 'completed')
+        self.assertEqual(controller.get_manual_mode_status()['completed_tasks'], 1)
+        mock_worker.execute_task.assert_called_once()
+        
+        controller.shutdown()
+    
+    @patch('botted_library.core.interfaces.Task')
+    def test_async_task_status_update_waits_for_lock(self, mock_task_class):
+        """Test a background task records its outcome only while holding the tasks lock"""
+        controller = ManualModeController(
+            server_instance=self.mock_server,
+            config={'async_tasks': True}
+        )
+        
+        release_worker = threading.Event()
+        mock_result = Mock()
+        mock_result.is_successful.return_value = True
+        
+        def execute_task(task):
+            release_worker.wait(5)
+            return mock_result
+        
+        mock_worker = Mock()
+        mock_worker.execute_task.side_effect = execute_task
+        
+        worker_id = "test_worker_id"
+        controller.manual_workers[worker_id] = {
+            'worker_instance': mock_worker,
+            'name': 'Test Worker',
+            'worker_type': WorkerType.EXECUTOR,
+            'status': 'active'
+        }
+        mock_task_class.create_new.return_value = Mock()
+        
+        task_id = controller.assign_task_manually(worker_id=worker_id, task_description="Test task")
+        
+        with controller._tasks_lock:
+            release_worker.set()
+            time.sleep(0.05)
+            self.assertEqual(controller.manual_tasks[task_id]['status'], 'assigned')
+            self.assertIn(task_id, controller._tasks_by_status['assigned'])
+        
+        controller._task_pool.shutdown(wait=True)
+        
+        self.assertEqual(controller.get_manual_tasks()[task_id]['status'], 'completed')
+        self.assertEqual(controller.get_manual_mode_status()['completed_tasks'], 1)
+        self.assertIn('result', controller.manual_tasks[task_id])
+        
+        controller.shutdown()
+    
     def test_assign_task_to_nonexistent_worker(self):
         """Test task assignment to non-existent worker"""
         with self.assertRaises(WorkerError):
@@ -204,6 +284,50 @@ class TestManualModeController(unittest.TestCase):
         self.assertEqual(workers[worker_id]['name'], 'Test Worker')
         self.assertEqual(workers[worker_id]['worker_type'], 'planner')
     
+    def test_get_manual_workers_since(self):
+        """Test getting only workers created after a given time"""
+        now = datetime.now()
+        for offset in range(3):
+            self.controller.manual_workers[f"worker_{offset}"] = {
+                'name': f'Worker {offset}',
+                'role': 'Test Role',
+                'worker_type': WorkerType.EXECUTOR,
+                'capabilities': [],
+                'created_at': now + timedelta(seconds=offset),
+                'status': 'active'
+            }
+        
+        workers = self.controller.get_manual_workers(since=now)
+        
+        self.assertEqual(list(workers), ['worker_1', 'worker_2'])
+        self.assertEqual(len(self.controller.get_manual_workers()), 3)
+    
+    def test_space_participants_in_join_order(self):
+        """Test space participants are listed in the order they joined"""
+        mock_space = Mock()
+        mock_space.space_id = "test_space_id"
+        self.mock_server.create_collaborative_space.return_value = mock_space
+        
+        worker_ids = ["worker_c", "worker_a", "worker_d", "worker_b"]
+        for worker_id in worker_ids:
+            worker_instance = Mock()
+            worker_instance.join_collaborative_space.return_value = True
+            worker_instance.leave_collaborative_space.return_value = True
+            self.controller.manual_workers[worker_id] = {'worker_instance': worker_instance}
+        
+        space_id = self.controller.create_collaborative_space_manually(
+            space_name="Test Space",
+            description="Test collaborative space",
+            initial_participants=worker_ids[:2]
+        )
+        for worker_id in worker_ids[2:]:
+            self.assertTrue(self.controller.add_worker_to_space(worker_id, space_id))
+        self.assertTrue(self.controller.remove_worker_from_space("worker_a", space_id))
+        
+        space = self.controller.get_manual_spaces()[space_id]
+        self.assertEqual(space['participants'], ["worker_c", "worker_d", "worker_b"])
+        self.assertEqual(space['participant_count'], 3)
+    
     def test_register_ui_callback(self):
         """Test UI callback registration"""
         callback = Mock()
@@ -221,6 +345,13 @@ class TestManualModeController(unittest.TestCase):
         self.assertEqual(status['active_workers'], 0)
         self.assertEqual(status['active_spaces'], 0)
         self.assertIn('statistics', status)
+    
+    def test_patch_instance_method(self):
+        """Test controller methods can be patched on the instance"""
+        with patch.object(self.controller, 'get_manual_mode_status', return_value={'mode': 'patched'}):
+            self.assertEqual(self.controller.get_manual_mode_status(), {'mode': 'patched'})
+        
+        self.assertEqual(self.controller.get_manual_mode_status()['mode'], 'manual')
 
 
 class TestAutoModeController(unittest.TestCase):